@@ -0,0 +1,82 @@
+#! /usr/bin/env python3
+"""Throughput of format_relativedelta(), with and without the format cache.
+
+The float-based formatter that was used before is included for
+reference.  Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_format.py [count]
+"""
+import random
+import sys
+import time
+
+from dateutil.relativedelta import relativedelta
+
+from relativedeltafield.utils import format_relativedelta, set_format_cache
+
+
+def float_format_relativedelta(relativedelta):
+    result_big = ''
+    if relativedelta.years:
+        result_big += '{}Y'.format(relativedelta.years)
+    if relativedelta.months:
+        result_big += '{}M'.format(relativedelta.months)
+    if relativedelta.days:
+        result_big += '{}D'.format(relativedelta.days)
+
+    result_small = ''
+    if relativedelta.hours:
+        result_small += '{}H'.format(relativedelta.hours)
+    if relativedelta.minutes:
+        result_small += '{}M'.format(relativedelta.minutes)
+    if relativedelta.seconds:
+        seconds = relativedelta.seconds
+        if relativedelta.microseconds:
+            seconds += relativedelta.microseconds / 1000000.0
+        result_small += '{}S'.format(seconds)
+
+    if len(result_small) > 0:
+        return 'P{}T{}'.format(result_big, result_small)
+    elif len(result_big) == 0:
+        return 'P0D'
+    else:
+        return 'P{}'.format(result_big)
+
+
+def random_values(count):
+    random.seed(0)
+    return [
+        relativedelta(years=random.randint(0, 10), months=random.randint(0, 11), days=random.randint(0, 30),
+                      hours=random.randint(0, 23), minutes=random.randint(0, 59),
+                      seconds=random.randint(1, 59), microseconds=random.randint(0, 999999))
+        for i in range(count)
+    ]
+
+
+def repeated_values(count):
+    common = [relativedelta(months=1), relativedelta(months=3), relativedelta(years=1),
+              relativedelta(days=7), relativedelta(days=1), relativedelta(hours=1, minutes=30)]
+    return [common[i % len(common)] for i in range(count)]
+
+
+def run(label, func, values):
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    elapsed = time.perf_counter() - start
+    print('{:<45} {:>8.3f} s {:>12,.0f} values/s'.format(label, elapsed, len(values) / elapsed))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    for name, values in (('distinct', random_values(count)), ('repeated', repeated_values(count))):
+        print('{:,} {} values'.format(count, name))
+        run('  float formatter (before)', float_format_relativedelta, values)
+        run('  format_relativedelta()', format_relativedelta, values)
+        set_format_cache(1024)
+        run('  format_relativedelta(), cache of 1024', format_relativedelta, values)
+        set_format_cache(0)
+
+
+if __name__ == '__main__':
+    main()
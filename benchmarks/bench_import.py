@@ -0,0 +1,57 @@
+#! /usr/bin/env python3
+"""Import time of the relativedeltafield modules.
+
+Every import is timed in a fresh interpreter, so nothing is cached
+between runs.  Run from the repository root:
+
+    PYTHONPATH=src:tests/testproject python benchmarks/bench_import.py
+"""
+import os
+import subprocess
+import sys
+
+RUNS = 10
+
+STATEMENT = '''
+import sys, time
+start = time.perf_counter()
+{setup}
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, 'django.contrib.admin' in sys.modules, 'django' in sys.modules)
+'''
+
+DJANGO_SETUP = (
+    "import os, django; "
+    "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'testproject.settings'); "
+    "os.environ.setdefault('DBENGINE', 'sqlite'); "
+    "django.setup()"
+)
+
+CASES = [
+    ('relativedeltafield.utils', ''),
+    ('relativedeltafield', ''),
+    ('relativedeltafield.fields', ''),
+    ('django', DJANGO_SETUP),
+]
+
+
+def time_import(module, setup):
+    code = STATEMENT.format(module=module, setup=setup)
+    timings = []
+    for _ in range(RUNS):
+        out = subprocess.check_output([sys.executable, '-c', code], env=os.environ).decode().split()
+        timings.append(float(out[0]))
+    return min(timings), out[1] == 'True', out[2] == 'True'
+
+
+def main():
+    print('{:<30} {:>10} {:>8} {:>8}'.format('module', 'best (ms)', 'admin', 'django'))
+    for module, setup in CASES:
+        label = module if not setup else 'django.setup() (reference)'
+        best, admin, django = time_import(module, setup)
+        print('{:<30} {:>10.2f} {:>8} {:>8}'.format(label, best * 1000, str(admin), str(django)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+#! /usr/bin/env python3
+"""Throughput of parse_relativedelta_parallel() for growing numbers of workers.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_parallel_parse.py [count]
+"""
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from dateutil.relativedelta import relativedelta
+
+from relativedeltafield.utils import (format_relativedelta, parse_relativedelta,
+                                      parse_relativedelta_parallel,
+                                      relativedelta_as_csv)
+
+
+def make_values(count):
+    random.seed(0)
+    values = []
+    for i in range(count):
+        rd = relativedelta(years=random.randint(0, 10), months=random.randint(0, 11), days=random.randint(0, 30),
+                           hours=random.randint(0, 23), minutes=random.randint(0, 59),
+                           seconds=random.randint(0, 59), microseconds=random.randint(0, 999999))
+        values.append(relativedelta_as_csv(rd) if i % 2 else format_relativedelta(rd))
+    return values
+
+
+def run(label, func, values):
+    start = time.perf_counter()
+    func(values)
+    elapsed = time.perf_counter() - start
+    print('{:<40} {:>8.3f} s {:>12,.0f} values/s'.format(label, elapsed, len(values) / elapsed))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    values = make_values(count)
+    print('{:,} values, {} CPUs'.format(count, os.cpu_count()))
+    run('parse_relativedelta()', lambda v: [parse_relativedelta(x) for x in v], values)
+    run('parse_relativedelta_parallel(), 1 worker', lambda v: parse_relativedelta_parallel(v, max_workers=1), values)
+    workers = 2
+    while workers <= (os.cpu_count() or 1):
+        # Start the pool up front, so that only the parsing is timed
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(abs, range(workers)))
+            run('parse_relativedelta_parallel(), {} workers'.format(workers),
+                lambda v: parse_relativedelta_parallel(v, executor=executor), values)
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,23 @@
 __version__ = '1.1.2'
 
-from django.contrib.admin.options import FORMFIELD_FOR_DBFIELD_DEFAULTS
+# The fields and form fields are imported on first access, so that
+# importing relativedeltafield.utils does not require Django.  The admin
+# integration is set up by RelativeDeltaConfig.ready().
+_lazy_attributes = {
+    'RelativeDeltaArrayField': 'fields',
+    'RelativeDeltaField': 'fields',
+    'RelativeDeltaArrayFormField': 'forms',
+    'RelativeDeltaFormField': 'forms',
+}
 
-from .fields import RelativeDeltaField # noqa
-from .forms import RelativeDeltaFormField # noqa
 
-FORMFIELD_FOR_DBFIELD_DEFAULTS[RelativeDeltaField] = {
-    'form_class': RelativeDeltaFormField
-}
+def __getattr__(name):
+    if name in _lazy_attributes:
+        from importlib import import_module
+        module = import_module('.' + _lazy_attributes[name], __name__)
+        return getattr(module, name)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_attributes))
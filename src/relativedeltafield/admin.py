@@ -0,0 +1,128 @@
+import hashlib
+
+from django.contrib.admin.filters import FieldListFilter
+from django.contrib.admin.utils import reverse_field_path
+from django.core.cache import caches
+from django.db import connections
+from django.db.models import CharField, Count, F, Func, Value
+from django.db.models.constants import LOOKUP_SEP
+from relativedeltafield.fields import (PG_INTERVAL_FORMAT,
+                                       RelativeDeltaArrayField,
+                                       RelativeDeltaField, raw_db_values)
+from relativedeltafield.utils import (COMPONENTS, format_db_relativedelta,
+                                      format_relativedelta,
+                                      parse_relativedelta_components)
+
+try:
+    from django.utils.translation import gettext_lazy as _
+except ImportError:
+    from django.utils.translation import ugettext as _
+
+
+class RelativeDeltaListFilter(FieldListFilter):
+    """Changelist filter with a choice for each distinct interval.
+
+    The intervals and their counts are fetched with a single GROUP BY
+    query, without parsing the values, and cached for ``cache_timeout``
+    seconds.  Choosing one filters on equality with the stored value.
+
+    PostgreSQL considers intervals such as '1 mon' and '30 days' equal.
+    They are grouped by their text, so they are listed separately, but
+    choosing either matches both.
+    """
+    cache_alias = 'default'
+    cache_timeout = 300
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.lookup_kwarg = '%s__exact' % field_path
+        self.lookup_kwarg_isnull = '%s__isnull' % field_path
+        self.lookup_val = params.get(self.lookup_kwarg)
+        self.lookup_val_isnull = params.get(self.lookup_kwarg_isnull)
+        self.empty_value_display = model_admin.get_empty_value_display()
+        # A dictionary-encoded field would lead reverse_field_path() to
+        # the dictionary, so only follow the relations leading to it
+        relation_path = field_path.rpartition(LOOKUP_SEP)[0]
+        parent_model = reverse_field_path(model, relation_path)[0] if relation_path else model
+        # Obey parent ModelAdmin queryset when deciding which options to show
+        if model == parent_model:
+            queryset = model_admin.get_queryset(request)
+        else:
+            queryset = parent_model._default_manager.all()
+        self.field = field
+        self.lookup_choices = self.get_buckets(queryset, field.name)
+        super().__init__(field, request, params, model, model_admin, field_path)
+
+    def get_buckets(self, queryset, name):
+        """Return a list of (display, count) pairs; display is None for NULL."""
+        queryset = queryset.order_by().values(bucket=self.get_bucket_expression(queryset, name))
+        queryset = queryset.annotate(count=Count('*'))
+        key = 'relativedeltafield.buckets.%s' % hashlib.md5(
+            ('%s:%s' % (queryset.db, queryset.query)).encode()
+        ).hexdigest()
+        cache = caches[self.cache_alias]
+        buckets = cache.get(key)
+        if buckets is None:
+            with raw_db_values():
+                rows = list(queryset)
+            # The database can't order intervals by their components
+            rows.sort(key=lambda row: _bucket_order(row['bucket']))
+            buckets = [(self.format_value(row['bucket']), row['count']) for row in rows]
+            cache.set(key, buckets, self.cache_timeout)
+        return buckets
+
+    def get_bucket_expression(self, queryset, name):
+        # Grouping by an INTERVAL would merge intervals PostgreSQL
+        # considers equal, so group by the text select_format() reads
+        if connections[queryset.db].vendor == 'postgresql' and not self.field.dictionary:
+            return Func(F(name), Value(PG_INTERVAL_FORMAT), function='to_char', output_field=CharField())
+        return F(name)
+
+    def format_value(self, value):
+        if value is None:
+            return None
+        # Raw database strings, except for dictionary-encoded fields
+        if isinstance(value, str):
+            return format_db_relativedelta(value)
+        return format_relativedelta(value)
+
+    def expected_parameters(self):
+        return [self.lookup_kwarg, self.lookup_kwarg_isnull]
+
+    def choices(self, changelist):
+        yield {
+            'selected': self.lookup_val is None and self.lookup_val_isnull is None,
+            'query_string': changelist.get_query_string(remove=[self.lookup_kwarg, self.lookup_kwarg_isnull]),
+            'display': _('All'),
+        }
+        none_count = None
+        for val, count in self.lookup_choices:
+            if val is None:
+                none_count = count
+                continue
+            yield {
+                'selected': self.lookup_val == val,
+                'query_string': changelist.get_query_string({self.lookup_kwarg: val}, [self.lookup_kwarg_isnull]),
+                'display': '%s (%d)' % (val, count),
+            }
+        if none_count is not None:
+            yield {
+                'selected': bool(self.lookup_val_isnull),
+                'query_string': changelist.get_query_string({self.lookup_kwarg_isnull: 'True'}, [self.lookup_kwarg]),
+                'display': '%s (%d)' % (self.empty_value_display, none_count),
+            }
+
+
+def _bucket_order(value):
+    if value is None:
+        return (1, ())
+    # Raw database strings, except for dictionary-encoded fields
+    if isinstance(value, str):
+        return (0, parse_relativedelta_components(value))
+    return (0, tuple(getattr(value, name) for name in COMPONENTS))
+
+
+FieldListFilter.register(
+    lambda f: isinstance(f, RelativeDeltaField) and not isinstance(f, RelativeDeltaArrayField),
+    RelativeDeltaListFilter,
+    take_priority=True,
+)
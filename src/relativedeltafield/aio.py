@@ -0,0 +1,183 @@
+"""Helpers for loading and saving intervals from async code.
+
+Rows are fetched in batches through Django's thread-sensitive
+sync_to_async(), like the async ORM does.  Interval values are fetched
+unparsed, and large batches are converted in a worker thread, so that
+the event loop stays responsive while big querysets are processed.
+"""
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldError
+from django.db import connections
+from relativedeltafield.bulk import (restore_values, trust_values,
+                                     trusted_fields)
+from relativedeltafield.fields import (PreparedRelativeDelta,
+                                       RelativeDeltaArrayField,
+                                       RelativeDeltaField, raw_db_values)
+from relativedeltafield.utils import (COMPONENTS, parse_relativedelta_array,
+                                      parse_relativedelta_components,
+                                      relativedelta_from_components)
+
+BATCH_SIZE = 2000
+
+# Batches with fewer values than this are converted on the event loop,
+# as handing them to a thread would take longer.
+OFFLOAD_THRESHOLD = 500
+
+
+async def _convert(func, values, offload_threshold):
+    if len(values) < offload_threshold:
+        return func(values)
+    return await sync_to_async(func, thread_sensitive=False)(values)
+
+
+def _fetch(iterator, batch_size):
+    with raw_db_values():
+        return list(islice(iterator, batch_size))
+
+
+def _parser(field):
+    if isinstance(field, RelativeDeltaArrayField):
+        return parse_relativedelta_array
+    return lambda value: relativedelta_from_components(parse_relativedelta_components(value))
+
+
+def _output_field(expression):
+    try:
+        return expression.output_field
+    except FieldError:
+        return None
+
+
+def _interval_parsers(queryset):
+    # Finds the interval columns of the rows of a values_list() queryset
+    # by their output field, which is also what picks the converters that
+    # raw_db_values() affects.
+    query = queryset.query.chain()
+    compiler = query.get_compiler(queryset.db)
+    compiler.setup_query()
+    fields = [_output_field(expression) for expression, _sql, _alias in compiler.select]
+    if queryset._fields:
+        # Like ValuesListIterable, put the columns in the requested order
+        names = [*query.extra_select, *query.values_select, *query.annotation_select]
+        order = [*queryset._fields, *(name for name in query.annotation_select if name not in queryset._fields)]
+        fields = [fields[names.index(name)] for name in order]
+    return [
+        (i, _parser(field)) for i, field in enumerate(fields)
+        if isinstance(field, RelativeDeltaField) and not field.dictionary
+    ]
+
+
+def _parse_rows(rows, parsers):
+    result = []
+    for row in rows:
+        row = list(row)
+        for i, parse in parsers:
+            if isinstance(row[i], str):
+                row[i] = parse(row[i])
+        result.append(tuple(row))
+    return result
+
+
+async def aiter_intervals(queryset, *fields, flat=False, batch_size=BATCH_SIZE,
+                          offload_threshold=OFFLOAD_THRESHOLD):
+    """Asynchronously iterate over ``queryset.values_list(*fields)``.
+
+    Interval columns are parsed a batch at a time; batches of at least
+    ``offload_threshold`` rows are parsed in a worker thread.
+    """
+    if flat and len(fields) != 1:
+        raise TypeError("'flat' is not valid when aiter_intervals is called with more than one field.")
+    queryset = queryset.values_list(*fields)
+    parsers = _interval_parsers(queryset)
+    iterator = await sync_to_async(lambda: iter(queryset.iterator(chunk_size=batch_size)))()
+    while True:
+        rows = await sync_to_async(_fetch)(iterator, batch_size)
+        if not rows:
+            break
+        rows = await _convert(lambda rows: _parse_rows(rows, parsers), rows, offload_threshold)
+        for row in rows:
+            yield row[0] if flat else row
+
+
+def _prepare_objs(objs, fields, connection):
+    originals = []
+    for obj in objs:
+        values = {}
+        for field in fields:
+            value = obj.__dict__.get(field.attname)
+            if value is not None and not isinstance(value, PreparedRelativeDelta):
+                values[field.attname] = value
+                obj.__dict__[field.attname] = PreparedRelativeDelta(
+                    field.get_db_prep_save(value, connection), connection.vendor
+                )
+        originals.append(values)
+    return originals
+
+
+async def abulk_create(model, objs, batch_size=None, using=None, offload_threshold=OFFLOAD_THRESHOLD,
+                       trusted=False, **kwargs):
+    """Asynchronous ``model.objects.bulk_create(objs)``.
+
+    Interval values are converted to their database representation up
+    front, in a worker thread for at least ``offload_threshold`` objects.
+    With ``trusted=True``, strings are passed on as is instead, like
+    bulk_create_trusted() does.  The objects keep their original values.
+    """
+    objs = list(objs)
+    queryset = model._default_manager.using(using) if using else model._default_manager.all()
+    connection = connections[queryset.db]
+    if trusted:
+        originals = trust_values(objs, trusted_fields(model, connection), connection.vendor)
+    else:
+        fields = [
+            f for f in model._meta.concrete_fields
+            if isinstance(f, RelativeDeltaField) and not isinstance(f, RelativeDeltaArrayField) and not f.dictionary
+        ]
+        originals = await _convert(lambda objs: _prepare_objs(objs, fields, connection), objs, offload_threshold)
+    try:
+        return await sync_to_async(queryset.bulk_create)(objs, batch_size=batch_size, **kwargs)
+    finally:
+        restore_values(objs, originals)
+
+
+def _sum_components(values):
+    total = [0] * len(COMPONENTS)
+    count = 0
+    for value in values:
+        if value is not None:
+            count += 1
+            for i, component in enumerate(parse_relativedelta_components(value)):
+                total[i] += component
+    return total, count
+
+
+async def asum_intervals(queryset, field_name, batch_size=BATCH_SIZE, offload_threshold=OFFLOAD_THRESHOLD):
+    """Asynchronously sum an interval column, or return None if it is empty.
+
+    PostgreSQL sums the intervals itself.  Elsewhere, the values are summed
+    a batch at a time like aiter_intervals() parses them.
+    """
+    field = queryset.model._meta.get_field(field_name)
+    if field.dictionary or isinstance(field, RelativeDeltaArrayField):
+        raise TypeError('Only intervals stored as such can be summed.')
+    if connections[queryset.db].vendor == 'postgresql':
+        from django.db.models import Sum
+        return (await sync_to_async(queryset.aggregate)(
+            total=Sum(field_name, output_field=RelativeDeltaField())
+        ))['total']
+
+    iterator = await sync_to_async(
+        lambda: iter(queryset.values_list(field_name, flat=True).iterator(chunk_size=batch_size))
+    )()
+    total = [0] * len(COMPONENTS)
+    count = 0
+    while True:
+        values = await sync_to_async(_fetch)(iterator, batch_size)
+        if not values:
+            break
+        batch_total, batch_count = await _convert(_sum_components, values, offload_threshold)
+        total = [a + b for a, b in zip(total, batch_total)]
+        count += batch_count
+    return relativedelta_from_components(total) if count else None
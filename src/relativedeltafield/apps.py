@@ -0,0 +1,29 @@
+from django.apps import AppConfig, apps
+from django.conf import settings
+from relativedeltafield.utils import set_format_cache
+
+try:
+    from django.utils.translation import gettext_lazy as _
+except ImportError:
+    from django.utils.translation import ugettext as _
+
+
+class RelativeDeltaConfig(AppConfig):
+    name = 'relativedeltafield'
+    verbose_name = _('RelativeDelta')
+    default_auto_field = 'django.db.models.AutoField'
+
+    def ready(self):
+        set_format_cache(getattr(settings, 'RELATIVEDELTAFIELD_FORMAT_CACHE_SIZE', 0))
+        if apps.is_installed('django.contrib.admin'):
+            from django.contrib.admin.options import FORMFIELD_FOR_DBFIELD_DEFAULTS
+
+            from relativedeltafield.fields import RelativeDeltaArrayField, RelativeDeltaField
+            from relativedeltafield.forms import RelativeDeltaArrayFormField, RelativeDeltaFormField
+
+            FORMFIELD_FOR_DBFIELD_DEFAULTS[RelativeDeltaField] = {
+                'form_class': RelativeDeltaFormField
+            }
+            FORMFIELD_FOR_DBFIELD_DEFAULTS[RelativeDeltaArrayField] = {
+                'form_class': RelativeDeltaArrayFormField
+            }
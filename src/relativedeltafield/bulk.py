@@ -0,0 +1,72 @@
+"""Bulk writes of interval values that are already in database format.
+
+In trusted mode, strings assigned to interval fields are sent to the
+database without being parsed or validated in Python.  The database
+rejects malformed values itself: PostgreSQL parses INTERVAL input, and
+other databases need the CHECK constraint of ``check_format=True``.
+"""
+from django.db import connections
+from relativedeltafield.fields import (PreparedRelativeDelta,
+                                       RelativeDeltaArrayField,
+                                       RelativeDeltaField)
+
+
+def trusted_fields(model, connection):
+    """Return the interval fields of ``model`` that can be written in trusted mode.
+
+    Raises ValueError if the database wouldn't validate one of them.
+    """
+    fields = [
+        f for f in model._meta.concrete_fields
+        if isinstance(f, RelativeDeltaField) and not isinstance(f, RelativeDeltaArrayField) and not f.dictionary
+    ]
+    if connection.vendor != 'postgresql':
+        # MySQL before 8.0.16 accepts CHECK constraints, but ignores them
+        checked = connection.features.supports_column_check_constraints
+        for field in fields:
+            if not (checked and field.db_check(connection)):
+                raise ValueError(
+                    "Can't write %s.%s in trusted mode, as the database doesn't check its format. "
+                    "Set check_format=True on the field and migrate." % (model._meta.label, field.name)
+                )
+    return fields
+
+
+def trust_values(objs, fields, vendor):
+    """Mark the string values of ``fields`` as being in database format.
+
+    Returns the original values, to be put back by restore_values().
+    """
+    originals = []
+    for obj in objs:
+        values = {}
+        for field in fields:
+            value = obj.__dict__.get(field.attname)
+            if isinstance(value, str):
+                values[field.attname] = value
+                obj.__dict__[field.attname] = PreparedRelativeDelta(value, vendor)
+        originals.append(values)
+    return originals
+
+
+def restore_values(objs, originals):
+    for obj, values in zip(objs, originals):
+        obj.__dict__.update(values)
+
+
+def bulk_create_trusted(model, objs, batch_size=None, using=None, **kwargs):
+    """``model.objects.bulk_create(objs)`` in trusted mode.
+
+    String values of interval fields must be in the database
+    representation: ISO8601 or any other INTERVAL input on PostgreSQL,
+    the internal representation elsewhere.  Other values are converted
+    as usual.
+    """
+    objs = list(objs)
+    queryset = model._default_manager.using(using) if using else model._default_manager.all()
+    connection = connections[queryset.db]
+    originals = trust_values(objs, trusted_fields(model, connection), connection.vendor)
+    try:
+        return queryset.bulk_create(objs, batch_size=batch_size, **kwargs)
+    finally:
+        restore_values(objs, originals)
@@ -1,7 +1,16 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from dateutil.relativedelta import relativedelta
 from django.core.exceptions import ValidationError
 from django.db import models
-from relativedeltafield.utils import (format_relativedelta,
+from django.db.models.lookups import Exact, In, IsNull
+from relativedeltafield.forms import (RelativeDeltaArrayFormField,
+                                      RelativeDeltaFormField)
+from relativedeltafield.utils import (ARRAY_SEPARATOR, format_relativedelta,
                                       parse_relativedelta,
+                                      parse_relativedelta_array,
+                                      relativedelta_array_as_csv,
                                       relativedelta_as_csv)
 
 try:
@@ -9,6 +18,71 @@ try:
 except ImportError:
     from django.utils.translation import ugettext as _
 
+# Output format of an INTERVAL on PostgreSQL, see select_format() below
+PG_INTERVAL_FORMAT = 'PYYYY"Y"MM"M"DD"DT"HH24"H"MI"M"SS.US"S"'
+
+# CHECK constraints enforcing the layout of the internal representation
+# (see iso8601_csv_re) on databases without INTERVAL.  They also bound the
+# months, hours, minutes, seconds and microseconds like normalized()
+# does, so that values which wouldn't compare equal are rejected.
+_csv_regexp = (
+    '^[-0-9][0-9]{4}/[-0](0[0-9]|1[01])/[-0-9][0-9]{2} '
+    '[-0]([01][0-9]|2[0-3]):[-0][0-5][0-9]:[-0][0-5][0-9][.][-0][0-9]{6}$'
+)
+_csv_glob = (
+    '[-0-9][0-9][0-9][0-9][0-9]/[-0][01][0-9]/[-0-9][0-9][0-9] '
+    '[-0][0-2][0-9]:[-0][0-5][0-9]:[-0][0-5][0-9].[-0][0-9][0-9][0-9][0-9][0-9][0-9]'
+)
+CSV_CHECK_CONSTRAINTS = {
+    # GLOB has no alternatives, so months and hours are bounded separately
+    'sqlite': "%%(qn_column)s GLOB '%s' AND substr(%%(qn_column)s, 8, 2) <= '11' "
+              "AND substr(%%(qn_column)s, 16, 2) <= '23'" % _csv_glob,
+    'mysql': "%%(qn_column)s REGEXP '%s'" % _csv_regexp,
+    'oracle': "REGEXP_LIKE(%%(qn_column)s, '%s')" % _csv_regexp,
+}
+
+_raw_db_values = ContextVar('relativedeltafield_raw_db_values', default=False)
+
+
+@contextmanager
+def raw_db_values():
+    """Make from_db_value() return database values without parsing them.
+
+    Model instances still parse them on attribute access, through the
+    descriptor; values() and values_list() return the raw strings.
+    Dictionary-encoded fields are not affected.
+    """
+    token = _raw_db_values.set(True)
+    try:
+        yield
+    finally:
+        _raw_db_values.reset(token)
+
+
+# The attributes relativedelta.__init__() sets
+_RELATIVEDELTA_ATTRIBUTES = frozenset(vars(relativedelta()))
+
+
+class PreparedRelativeDelta(relativedelta):
+    """A relativedelta given in the database representation of ``vendor``.
+
+    It is only parsed once its value is used, so that it can be saved as
+    is on a database of that vendor when nothing looked at it.
+    """
+    def __init__(self, db_value, vendor):
+        self.db_value = db_value
+        self.vendor = vendor
+
+    @property
+    def parsed(self):
+        return '_has_time' in self.__dict__
+
+    def __getattr__(self, name):
+        if name not in _RELATIVEDELTA_ATTRIBUTES or 'db_value' not in self.__dict__:
+            raise AttributeError(name)
+        self.__dict__.update(vars(parse_relativedelta(self.db_value)))
+        return self.__dict__[name]
+
 
 class RelativeDeltaDescriptor:
     def __init__(self, field) -> None:
@@ -18,8 +92,8 @@ class RelativeDeltaDescriptor:
         if obj is None:
             return None
         value = obj.__dict__.get(self.field.name)
-        if value is None:
-            return None
+        if value is None or isinstance(value, PreparedRelativeDelta):
+            return value
         try:
             return parse_relativedelta(value)
         except ValueError as e:
@@ -32,7 +106,10 @@ class RelativeDeltaDescriptor:
 class RelativeDeltaField(models.Field):
     """Stores dateutil.relativedelta.relativedelta objects.
 
-    Uses INTERVAL on PostgreSQL.
+    Uses INTERVAL on PostgreSQL.  With ``dictionary=True``, a
+    RelativeDeltaDictionaryField is created instead.  With
+    ``check_format=True``, a CHECK constraint enforces the layout of the
+    VARCHAR used elsewhere.
     """
     empty_strings_allowed = False
     default_error_messages = {
@@ -41,10 +118,22 @@ class RelativeDeltaField(models.Field):
     }
     description = _("RelativeDelta")
     descriptor_class = RelativeDeltaDescriptor
+    dictionary = False
 
-    def get_lookup(self, lookup_name):
-        ret = super().get_lookup(lookup_name)
-        return ret
+    def __new__(cls, *args, dictionary=False, **kwargs):
+        if dictionary and cls is RelativeDeltaField:
+            cls = RelativeDeltaDictionaryField
+        return super().__new__(cls)
+
+    def __init__(self, *args, dictionary=False, check_format=False, **kwargs):
+        self.check_format = check_format
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.check_format:
+            kwargs['check_format'] = True
+        return name, path, args, kwargs
 
     def db_type(self, connection):
         if connection.vendor == 'postgresql':
@@ -52,10 +141,17 @@ class RelativeDeltaField(models.Field):
         else:
             return 'varchar(33)'
 
+    def db_check(self, connection):
+        if self.check_format and connection.vendor in CSV_CHECK_CONSTRAINTS:
+            return CSV_CHECK_CONSTRAINTS[connection.vendor] % self.db_type_parameters(connection)
+        return super().db_check(connection)
+
     def get_db_prep_save(self, value, connection):
         if value is None:
             return None
-        if connection.vendor == 'postgresql':
+        if isinstance(value, PreparedRelativeDelta) and not value.parsed and value.vendor == connection.vendor:
+            return value.db_value
+        elif connection.vendor == 'postgresql':
             return super().get_db_prep_save(value, connection)
         else:
             if isinstance(value, str):  # we need to convert it to the non-postgres format
@@ -98,15 +194,242 @@ class RelativeDeltaField(models.Field):
     # Django assumes PsycoPg2 returns pre-parsed datetime.timedeltas.
     def select_format(self, compiler, sql, params):
         if compiler.connection.vendor == 'postgresql':
-            fmt = 'to_char(%s, \'PYYYY"Y"MM"M"DD"DT"HH24"H"MI"M"SS.US"S"\')' % sql
+            fmt = 'to_char(%s, \'%s\')' % (sql, PG_INTERVAL_FORMAT)
         else:
             fmt = sql
         return fmt, params
 
     def from_db_value(self, value, expression, connection, context=None):
         if value is not None:
+            if _raw_db_values.get():
+                return value
             return parse_relativedelta(value)
 
     def value_to_string(self, obj):
         val = self.value_from_object(obj)
         return '' if val is None else format_relativedelta(val)
+
+    # The admin also picks this up, so it does not depend on the
+    # RelativeDeltaConfig registration when the app isn't installed.
+    def formfield(self, **kwargs):
+        return super().formfield(**{'form_class': RelativeDeltaFormField, **kwargs})
+
+
+class RelativeDeltaDictionaryRel(models.ForeignObjectRel):
+    """The relation of a RelativeDeltaDictionaryField to the dictionary.
+
+    Like ManyToOneRel, but serializers don't mistake the field for a
+    foreign key, whose value would be the entry's code.
+    """
+
+    def __init__(self, field, to, field_name=None, **kwargs):
+        super().__init__(field, to, **kwargs)
+        self.field_name = field_name
+
+    @property
+    def identity(self):
+        return super().identity + (self.field_name,)
+
+    def get_related_field(self):
+        return self.model._meta.get_field(self.field_name)
+
+    def set_field_name(self):
+        self.field_name = self.field_name or self.model._meta.pk.name
+
+
+class RelativeDeltaDictionaryField(RelativeDeltaField, models.ForeignObject):
+    """Stores relativedeltas as codes of shared RelativeDeltaDictionary entries.
+
+    Created by ``RelativeDeltaField(dictionary=True)``.  It has a column
+    like a ForeignKey, so that the database enforces the reference and
+    migrations depend on the dictionary table, but it is read and
+    written as a relativedelta, under the field's own name.
+    """
+    forward_related_accessor_class = RelativeDeltaDescriptor
+    rel_class = RelativeDeltaDictionaryRel
+    db_constraint = True
+    dictionary = True
+
+    def __init__(self, verbose_name=None, name=None, dictionary=True, **kwargs):
+        super().__init__(
+            'relativedeltafield.RelativeDeltaDictionary', models.PROTECT,
+            from_fields=['self'], to_fields=[None], related_name='+',
+            verbose_name=verbose_name, name=name, **kwargs
+        )
+
+    def deconstruct(self):
+        # Migrations recreate it through RelativeDeltaField(dictionary=True)
+        name, path, args, kwargs = models.Field.deconstruct(self)
+        kwargs['dictionary'] = True
+        return name, 'relativedeltafield.fields.RelativeDeltaField', args, kwargs
+
+    def get_attname_column(self):
+        return models.Field.get_attname_column(self)
+
+    def get_lookup(self, lookup_name):
+        # Dictionary codes are only meaningful for equality
+        if lookup_name not in ('exact', 'in', 'isnull'):
+            return None
+        return super().get_lookup(lookup_name)
+
+    def get_dictionary_code(self, value, connection, create):
+        return self.remote_field.model.objects.get_code(self.to_python(value), using=connection.alias, create=create)
+
+    def db_type(self, connection):
+        return self.target_field.rel_db_type(connection)
+
+    def get_db_prep_save(self, value, connection):
+        if value is None:
+            return None
+        return self.get_dictionary_code(value, connection, create=True)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if value is None:
+            return value
+        elif isinstance(value, self.remote_field.model):  # Deleting entries looks up their rows
+            return value.pk
+        else:
+            # Looking up a value must not grow the dictionary.  Codes
+            # start at 1, so unknown values match no rows.
+            return self.get_dictionary_code(value, connection, create=False) or 0
+
+    def select_format(self, compiler, sql, params):
+        return sql, params
+
+    def from_db_value(self, value, expression, connection, context=None):
+        if value is not None:
+            return self.remote_field.model.objects.get_value(value, using=connection.alias)
+
+    def set_cached_value(self, instance, value):
+        # select_related() fetches entries, but the value is the relativedelta
+        pass
+
+    def formfield(self, **kwargs):
+        return models.Field.formfield(self, **{'form_class': RelativeDeltaFormField, **kwargs})
+
+
+class _DictionaryCodeLookupMixin:
+    # Related lookups prepare values for the referenced primary key, but
+    # these are relativedeltas to look up in the dictionary
+    def get_db_prep_lookup(self, value, connection):
+        prep = self.lhs.output_field.get_db_prep_value
+        if self.get_db_prep_lookup_value_is_iterable:
+            return '%s', [prep(v, connection, prepared=True) for v in value]
+        return '%s', [prep(value, connection, prepared=True)]
+
+
+class _DictionaryExact(_DictionaryCodeLookupMixin, Exact):
+    pass
+
+
+class _DictionaryIn(_DictionaryCodeLookupMixin, In):
+    pass
+
+
+RelativeDeltaDictionaryField.register_lookup(_DictionaryExact)
+RelativeDeltaDictionaryField.register_lookup(_DictionaryIn)
+RelativeDeltaDictionaryField.register_lookup(IsNull)
+
+
+class RelativeDeltaList(list):
+    """A list of normalized relativedeltas, as read from a RelativeDeltaArrayField.
+
+    The descriptor keeps it on the instance, so that changes made in
+    place are saved.
+    """
+
+
+class RelativeDeltaArrayDescriptor(RelativeDeltaDescriptor):
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return None
+        value = obj.__dict__.get(self.field.name)
+        if value is None or isinstance(value, RelativeDeltaList):
+            return value
+        try:
+            value = RelativeDeltaList(parse_relativedelta_array(value))
+        except ValueError as e:
+            raise ValidationError({self.field.name: e})
+        obj.__dict__[self.field.name] = value
+        return value
+
+
+class RelativeDeltaArrayField(RelativeDeltaField):
+    """Stores lists of dateutil.relativedelta.relativedelta objects.
+
+    Uses INTERVAL[] on PostgreSQL.  Other databases store the internal
+    representation of each element in a single text column.
+    """
+    default_error_messages = {
+        'invalid': _("'%(value)s' value has an invalid format. It must be a "
+                     "list of ISO8601 intervals.")
+    }
+    description = _("List of RelativeDelta")
+    descriptor_class = RelativeDeltaArrayDescriptor
+
+    def __init__(self, *args, **kwargs):
+        unsupported = [name for name in ('dictionary', 'check_format') if kwargs.get(name)]
+        if unsupported:
+            raise TypeError("RelativeDeltaArrayField doesn't support %s" % ', '.join(unsupported))
+        super().__init__(*args, **kwargs)
+
+    def db_type(self, connection):
+        if connection.vendor == 'postgresql':
+            return 'interval[]'
+        else:
+            return 'text'
+
+    def get_db_prep_save(self, value, connection):
+        return self.get_db_prep_value(value, connection)
+
+    def to_python(self, value):
+        if value is None:
+            return value
+        try:
+            return parse_relativedelta_array(value)
+        except (ValueError, TypeError):
+            raise ValidationError(
+                self.error_messages['invalid'],
+                code='invalid',
+                params={'value': value},
+            )
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if value is None:
+            return value
+        else:
+            values = self.to_python(value)
+            if connection.vendor == 'postgresql':
+                # An array literal, so that PostgreSQL casts it to INTERVAL[]
+                return '{%s}' % ARRAY_SEPARATOR.join(format_relativedelta(v) for v in values)
+            else:
+                return relativedelta_array_as_csv(values)
+
+    # Like RelativeDeltaField.select_format(), but every element is
+    # formatted and the results are joined into a single string, so
+    # that from_db_value() can parse the whole array in one go.  An
+    # empty array becomes an empty string rather than NULL.
+    def select_format(self, compiler, sql, params):
+        if compiler.connection.vendor == 'postgresql':
+            fmt = ('CASE WHEN %(sql)s IS NULL THEN NULL ELSE COALESCE(('
+                   'SELECT string_agg(to_char(t.v, \'%(format)s\'), \'%(sep)s\' ORDER BY t.i) '
+                   'FROM unnest(%(sql)s) WITH ORDINALITY AS t(v, i)), \'\') END' % {
+                       'sql': sql, 'format': PG_INTERVAL_FORMAT, 'sep': ARRAY_SEPARATOR,
+                   })
+            params = tuple(params) * 2
+        else:
+            fmt = sql
+        return fmt, params
+
+    def from_db_value(self, value, expression, connection, context=None):
+        if value is not None:
+            if _raw_db_values.get():
+                return value
+            return RelativeDeltaList(parse_relativedelta_array(value))
+
+    def value_to_string(self, obj):
+        val = self.value_from_object(obj)
+        return '' if val is None else ARRAY_SEPARATOR.join(format_relativedelta(v) for v in val)
+
+    def formfield(self, **kwargs):
+        return super().formfield(**{'form_class': RelativeDeltaArrayFormField, **kwargs})
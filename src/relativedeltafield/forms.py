@@ -1,7 +1,9 @@
 from django import forms
 from django.core.exceptions import ValidationError
 
-from relativedeltafield.utils import parse_relativedelta, format_relativedelta
+from relativedeltafield.utils import (ARRAY_SEPARATOR, format_relativedelta,
+                                      parse_relativedelta,
+                                      parse_relativedelta_array)
 
 
 class RelativeDeltaFormField(forms.CharField):
@@ -20,3 +22,21 @@ class RelativeDeltaFormField(forms.CharField):
             return parse_relativedelta(value)
         except Exception:
             raise ValidationError('Not a valid (extended) ISO8601 interval specification', code='format')
+
+
+class RelativeDeltaArrayFormField(forms.CharField):
+
+    def prepare_value(self, value):
+        try:
+            return ARRAY_SEPARATOR.join(format_relativedelta(v) for v in value)
+        except Exception:
+            return value
+
+    def to_python(self, value):
+        return parse_relativedelta_array(value)
+
+    def clean(self, value):
+        try:
+            return parse_relativedelta_array(value)
+        except Exception:
+            raise ValidationError('Not a valid list of (extended) ISO8601 interval specifications', code='format')
@@ -0,0 +1,28 @@
+"""JSON Lines serializer with a fast path for RelativeDeltaField columns.
+
+Like relativedeltafield.serializers, but both dumping and loading take
+one object at a time, so large fixtures are never held in memory.  It
+requires Django 3.2 or later.  To use it for ``dumpdata`` and
+``loaddata``, add it to your settings::
+
+    SERIALIZATION_MODULES = {'jsonl': 'relativedeltafield.jsonl'}
+"""
+import json
+
+from django.core.serializers.jsonl import Serializer as JSONLSerializer
+from relativedeltafield.serializers import (RawIntervalsMixin,
+                                            deserialize_objects)
+
+
+class Serializer(RawIntervalsMixin, JSONLSerializer):
+    pass
+
+
+def Deserializer(stream_or_string, **options):
+    """Deserialize a stream or string of JSON Lines data."""
+    if isinstance(stream_or_string, bytes):
+        stream_or_string = stream_or_string.decode()
+    if isinstance(stream_or_string, str):
+        stream_or_string = stream_or_string.split('\n')
+    objects = (json.loads(line) for line in stream_or_string if line.strip())
+    yield from deserialize_objects(objects, **options)
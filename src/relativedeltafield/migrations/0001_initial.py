@@ -0,0 +1,27 @@
+from django.db import migrations, models
+import relativedeltafield.models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelativeDeltaDictionary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.CharField(max_length=33, unique=True, verbose_name='value')),
+            ],
+            options={
+                'verbose_name': 'relativedelta dictionary entry',
+                'verbose_name_plural': 'relativedelta dictionary entries',
+            },
+            managers=[
+                ('objects', relativedeltafield.models.RelativeDeltaDictionaryManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,108 @@
+from functools import partial
+
+from django.db import models, transaction
+from relativedeltafield.utils import parse_relativedelta, relativedelta_as_csv
+
+try:
+    from django.utils.translation import gettext_lazy as _
+except ImportError:
+    from django.utils.translation import ugettext as _
+
+
+class RelativeDeltaDictionaryManager(models.Manager):
+    use_in_migrations = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Caches of the dictionary, keyed by database alias.  They are
+        # filled with the whole table once, and entry by entry after that.
+        # Entries are never changed once committed, so the caches never go
+        # stale.  Entries inserted by a transaction are only cached once it
+        # commits, as its codes are gone if it is rolled back.
+        self._code_cache = {}
+        self._value_cache = {}
+        self._uncommitted = {}
+
+    def _add_to_cache(self, using, code, value):
+        parsed = parse_relativedelta(value)
+        if (code, value) not in self._uncommitted.get(using, ()):
+            self._code_cache[using][value] = code
+            self._value_cache[using][code] = parsed
+        return parsed
+
+    def _load_cache(self, using):
+        if using not in self._code_cache:
+            self._code_cache[using] = {}
+            self._value_cache[using] = {}
+            for code, value in self.using(using).values_list('pk', 'value'):
+                self._add_to_cache(using, code, value)
+
+    def _committed(self, using, code, value):
+        self._uncommitted[using].discard((code, value))
+        if using in self._code_cache:
+            self._add_to_cache(using, code, value)
+
+    def get_code(self, value, using, create=True):
+        """Return the code of a relativedelta, or None if it has none yet.
+
+        The code is inserted in the dictionary if ``create`` is set.
+        """
+        key = relativedelta_as_csv(value)
+        self._load_cache(using)
+        try:
+            return self._code_cache[using][key]
+        except KeyError:
+            pass
+        if not create:
+            code = self.using(using).filter(value=key).values_list('pk', flat=True).first()
+            if code is None:
+                return None
+        else:
+            entry, created = self.using(using).get_or_create(value=key)
+            code = entry.pk
+            if created:
+                self._uncommitted.setdefault(using, set()).add((code, key))
+                transaction.on_commit(partial(self._committed, using, code, key), using=using)
+                return code
+        self._add_to_cache(using, code, key)
+        return code
+
+    def get_value(self, code, using):
+        """Return the relativedelta of a code, parsing it at most once."""
+        self._load_cache(using)
+        try:
+            return self._value_cache[using][code]
+        except KeyError:
+            pass
+        value = self.using(using).filter(pk=code).values_list('value', flat=True).first()
+        if value is None:
+            raise ValueError('Unknown relativedelta dictionary code %r' % code)
+        return self._add_to_cache(using, code, value)
+
+    def clear_cache(self):
+        """Clear out the dictionary cache.
+
+        This forgets about entries inserted by uncommitted transactions as
+        well, so it should only be called outside of transactions.
+        """
+        self._code_cache.clear()
+        self._value_cache.clear()
+        self._uncommitted.clear()
+
+
+class RelativeDeltaDictionary(models.Model):
+    """Shared lookup table of dictionary-encoded RelativeDeltaField values.
+
+    Values are stored in the internal representation, which is unique for
+    each normalized relativedelta.
+    """
+    value = models.CharField(_('value'), max_length=33, unique=True)
+
+    objects = RelativeDeltaDictionaryManager()
+
+    class Meta:
+        verbose_name = _('relativedelta dictionary entry')
+        verbose_name_plural = _('relativedelta dictionary entries')
+
+    def __str__(self):
+        return self.value
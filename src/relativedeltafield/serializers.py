@@ -0,0 +1,126 @@
+"""JSON serializer with a fast path for RelativeDeltaField columns.
+
+Interval values are copied between the database and the fixture as
+strings, without building relativedelta objects.  To use it for
+``dumpdata`` and ``loaddata``, add it to your settings::
+
+    SERIALIZATION_MODULES = {'json': 'relativedeltafield.serializers'}
+
+Like Django's, the deserializer reads the whole fixture at once; see
+relativedeltafield.jsonl for one reading a line at a time.
+"""
+import json
+
+from django.apps import apps
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.json import Serializer as JSONSerializer
+from django.core.serializers.python import Deserializer as PythonDeserializer
+from django.db import DEFAULT_DB_ALIAS, connections
+from relativedeltafield.fields import (PreparedRelativeDelta,
+                                       RelativeDeltaArrayField,
+                                       RelativeDeltaField, raw_db_values)
+from relativedeltafield.utils import (ARRAY_SEPARATOR,
+                                      format_db_relativedelta,
+                                      prepare_db_relativedelta)
+
+
+def _raw_objects(queryset):
+    # Fetches the objects with raw_db_values(), without affecting the
+    # queries run while serializing each object
+    with raw_db_values():
+        iterator = iter(queryset)  # This runs the query of a QuerySet
+    while True:
+        with raw_db_values():
+            try:
+                obj = next(iterator)
+            except StopIteration:
+                return
+        yield obj
+
+
+class RawIntervalsMixin:
+    """Serializer mixin writing interval values without parsing them."""
+
+    def serialize(self, queryset, **options):
+        return super().serialize(_raw_objects(queryset), **options)
+
+    def handle_field(self, obj, field):
+        if isinstance(field, RelativeDeltaField) and not field.dictionary:
+            value = obj.__dict__.get(field.attname)
+            if isinstance(value, str):
+                if isinstance(field, RelativeDeltaArrayField):
+                    value = ARRAY_SEPARATOR.join(
+                        format_db_relativedelta(v) for v in value.split(ARRAY_SEPARATOR)
+                    ) if value else ''
+                else:
+                    value = format_db_relativedelta(value)
+                self._current[field.name] = value
+                return
+        super().handle_field(obj, field)
+
+
+class Serializer(RawIntervalsMixin, JSONSerializer):
+    pass
+
+
+def _interval_fields(model):
+    return [
+        f for f in model._meta.concrete_fields
+        if isinstance(f, RelativeDeltaField) and not isinstance(f, RelativeDeltaArrayField) and not f.dictionary
+    ]
+
+
+def _prepare_intervals(objects, vendor, prepared):
+    # Takes interval values that can be passed to the database as is out
+    # of each object, and stores them in prepared['values'] until the
+    # object comes out of the PythonDeserializer; it consumes the
+    # objects one by one, so that is always the last one taken.
+    fields_cache = {}
+    postgresql = vendor == 'postgresql'
+    for d in objects:
+        values = {}
+        try:
+            model = apps.get_model(d['model'])
+        except (KeyError, LookupError, TypeError, ValueError):
+            model = None  # Let the PythonDeserializer deal with this
+        if model is not None:
+            if model not in fields_cache:
+                fields_cache[model] = _interval_fields(model)
+            data = d.get('fields', {})
+            for field in fields_cache[model]:
+                value = data.get(field.name)
+                if isinstance(value, str):
+                    db_value = prepare_db_relativedelta(value, postgresql)
+                    if db_value is not None:
+                        values[field.attname] = PreparedRelativeDelta(db_value, vendor)
+                        del data[field.name]
+        prepared['values'] = values
+        yield d
+
+
+def deserialize_objects(objects, **options):
+    """Deserialize an iterable of dictionaries, taking one at a time."""
+    vendor = connections[options.get('using', DEFAULT_DB_ALIAS)].vendor
+    prepared = {}
+    try:
+        objects = _prepare_intervals(objects, vendor, prepared)
+        for deserialized in PythonDeserializer(objects, **options):
+            deserialized.object.__dict__.update(prepared['values'])
+            yield deserialized
+    except (GeneratorExit, DeserializationError):
+        raise
+    except Exception as exc:
+        raise DeserializationError() from exc
+
+
+def Deserializer(stream_or_string, **options):
+    """Deserialize a stream or string of JSON data."""
+    if not isinstance(stream_or_string, (bytes, str)):
+        stream_or_string = stream_or_string.read()
+    if isinstance(stream_or_string, bytes):
+        stream_or_string = stream_or_string.decode()
+    try:
+        objects = json.loads(stream_or_string)
+    except Exception as exc:
+        raise DeserializationError() from exc
+    yield from deserialize_objects(objects, **options)
@@ -1,5 +1,6 @@
 import re
 from datetime import timedelta
+from functools import lru_cache
 
 from dateutil.relativedelta import relativedelta
 
@@ -25,6 +26,33 @@ iso8601_csv_re = re.compile(r"^(?P<years>^[-\d]\d{4})/(?P<months>[-\d]\d{2})/(?P
                             r"(?P<hours>[-\d]\d{2}):(?P<minutes>[-\d]\d{2}):(?P<seconds>[-\d]\d{2})\."
                             r"(?P<microseconds>[-\d]\d{6})$")
 
+# Separator between the elements of a RelativeDeltaArrayField value
+ARRAY_SEPARATOR = ','
+
+# Layout of an INTERVAL rendered by RelativeDeltaField.select_format() on
+# PostgreSQL, and of the internal representation used elsewhere.
+_pg_layout = r'P(-?\d+)Y(-?\d+)M(-?\d+)DT(-?\d+)H(-?\d+)M(-?\d+)\.(-?\d{6})S'
+_csv_layout = r'([-\d]\d{4})/([-\d]\d{2})/([-\d]\d{2}) ([-\d]\d{2}):([-\d]\d{2}):([-\d]\d{2})\.([-\d]\d{6})'
+_pg_re = re.compile(_pg_layout + '$')
+_csv_re = re.compile(_csv_layout + '$')
+
+# Array elements in either layout.  These are matched repeatedly against
+# the whole array value, so each element includes its trailing separator.
+_array_pg_item_re = re.compile(_pg_layout + r'(?:,|$)')
+_array_csv_item_re = re.compile(_csv_layout + r'(?:,|$)')
+
+# The subset of ISO8601 written by format_relativedelta(): integral
+# components without weeks, and at most microsecond precision for seconds.
+_canonical_iso8601_re = re.compile(
+    r'P(?:(-?\d+)Y)?(?:(-?\d+)M)?(?:(-?\d+)D)?'
+    r'(?:T(?:(-?\d+)H)?(?:(-?\d+)M)?(?:(-?\d+)(?:\.(\d{1,6}))?S)?)?$'
+)
+
+CSV_FORMAT = '%05d/%03d/%03d %03d:%03d:%03d.%07d'
+
+# Order of the values in the tuples of parse_relativedelta_components()
+COMPONENTS = ('years', 'months', 'days', 'hours', 'minutes', 'seconds', 'microseconds')
+
 
 # Parse ISO8601 timespec
 def parse_relativedelta(value):
@@ -54,8 +82,89 @@ def parse_relativedelta(value):
     raise ValueError('Not a valid (extended) ISO8601 interval specification')
 
 
+def _db_components(m, pg):
+    # PostgreSQL prints the sign of negative seconds only once, in front
+    # of the seconds, whereas the internal representation signs seconds
+    # and microseconds separately.
+    years, months, days, hours, minutes, seconds, microseconds = m.groups()
+    microseconds = int(microseconds)
+    if pg and seconds[0] == '-' and microseconds > 0:
+        microseconds = -microseconds
+    return int(years), int(months), int(days), int(hours), int(minutes), int(seconds), microseconds
+
+
+def _fix_components(years, months, days, hours, minutes, seconds, microseconds):
+    # Integer equivalent of the carrying done by relativedelta's
+    # constructor, see relativedelta._fix()
+    if abs(microseconds) > 999999:
+        s = -1 if microseconds < 0 else 1
+        div, microseconds = divmod(microseconds * s, 1000000)
+        microseconds *= s
+        seconds += div * s
+    if abs(seconds) > 59:
+        s = -1 if seconds < 0 else 1
+        div, seconds = divmod(seconds * s, 60)
+        seconds *= s
+        minutes += div * s
+    if abs(minutes) > 59:
+        s = -1 if minutes < 0 else 1
+        div, minutes = divmod(minutes * s, 60)
+        minutes *= s
+        hours += div * s
+    if abs(hours) > 23:
+        s = -1 if hours < 0 else 1
+        div, hours = divmod(hours * s, 24)
+        hours *= s
+        days += div * s
+    if abs(months) > 11:
+        s = -1 if months < 0 else 1
+        div, months = divmod(months * s, 12)
+        months *= s
+        years += div * s
+    return years, months, days, hours, minutes, seconds, microseconds
+
+
+def _parse_array_batch(value):
+    pg = value[0] == 'P'
+    item_re = _array_pg_item_re if pg else _array_csv_item_re
+    result = []
+    pos = 0
+    for m in item_re.finditer(value):
+        if m.start() != pos:
+            break
+        pos = m.end()
+        years, months, days, hours, minutes, seconds, microseconds = _db_components(m, pg)
+        result.append(relativedelta(years=years, months=months, days=days, hours=hours,
+                                    minutes=minutes, seconds=seconds, microseconds=microseconds))
+    if pos != len(value) or value[-1] == ARRAY_SEPARATOR:
+        return None
+    return result
+
+
+# Parse a list of ISO8601 timespecs
+def parse_relativedelta_array(value):
+    if value is None:
+        return None
+    elif isinstance(value, (list, tuple)):
+        items = value
+    elif isinstance(value, str):
+        if value == '':
+            return []
+        # Database values are parsed in a single pass over the whole string
+        result = _parse_array_batch(value)
+        if result is not None:
+            return result
+        items = [item.strip() for item in value.split(ARRAY_SEPARATOR)]
+    else:
+        raise ValueError('Not a valid list of (extended) ISO8601 interval specifications')
+    result = [parse_relativedelta(item) for item in items]
+    if None in result:
+        raise ValueError('Not a valid list of (extended) ISO8601 interval specifications')
+    return result
+
+
 def relativedelta_as_csv(self) -> str:
-    return '%05d/%03d/%03d %03d:%03d:%03d.%07d' % (
+    return CSV_FORMAT % (
         self.years,
         self.months,
         self.days,
@@ -68,32 +177,140 @@ def relativedelta_as_csv(self) -> str:
 
 # Format ISO8601 timespec
 def format_relativedelta(relativedelta):
-    result_big = ''
+    return _format(relativedelta.years, relativedelta.months, relativedelta.days, relativedelta.hours,
+                   relativedelta.minutes, relativedelta.seconds, relativedelta.microseconds)
+
+
+def _format_seconds(seconds, microseconds):
+    if not microseconds:
+        return str(seconds)  # Like the other components, 2.0 is written as such
+    if type(seconds) is not int or type(microseconds) is not int:
+        if not (float(seconds).is_integer() and float(microseconds).is_integer()):
+            # Fractional values only occur in relativedeltas that weren't
+            # normalized, and can't be represented exactly anyway
+            return '{}'.format(seconds + microseconds / 1000000.0)
+        seconds, microseconds = int(seconds), int(microseconds)
+    total = seconds * 1000000 + microseconds
+    seconds, microseconds = divmod(abs(total), 1000000)
+    return '%s%d.%s' % ('-' if total < 0 else '', seconds, ('%06d' % microseconds).rstrip('0'))
+
+
+def _format_components(years, months, days, hours, minutes, seconds, microseconds):
     # TODO: We could always include all components, but that's kind of
     # ugly, since one second would be formatted as 'P0Y0M0W0DT0M1S'
-    if relativedelta.years:
-        result_big += '{}Y'.format(relativedelta.years)
-    if relativedelta.months:
-        result_big += '{}M'.format(relativedelta.months)
-    if relativedelta.days:
-        result_big += '{}D'.format(relativedelta.days)
-
-    result_small = ''
-    if relativedelta.hours:
-        result_small += '{}H'.format(relativedelta.hours)
-    if relativedelta.minutes:
-        result_small += '{}M'.format(relativedelta.minutes)
+    date = (f'{years}Y' if years else '') + (f'{months}M' if months else '') + (f'{days}D' if days else '')
+    if not (hours or minutes or seconds or microseconds):
+        return 'P' + date if date else 'P0D'  # Just 'P' is invalid syntax, and so is ''
+    time = (f'{hours}H' if hours else '') + (f'{minutes}M' if minutes else '')
     # Microseconds is allowed here as a convenience, the user may have
     # used normalized(), which can result in microseconds
-    if relativedelta.seconds:
-        seconds = relativedelta.seconds
-        if relativedelta.microseconds:
-            seconds += relativedelta.microseconds / 1000000.0
-        result_small += '{}S'.format(seconds)
-
-    if len(result_small) > 0:
-        return 'P{}T{}'.format(result_big, result_small)
-    elif len(result_big) == 0:
-        return 'P0D'  # Doesn't matter much what field is zero, but just 'P' is invalid syntax, and so is ''
-    else:
-        return 'P{}'.format(result_big)
+    if seconds or microseconds:
+        time += _format_seconds(seconds, microseconds) + 'S'
+    return 'P' + date + 'T' + time
+
+
+_format_cache = None
+
+
+def set_format_cache(maxsize):
+    """Cache the output of format_relativedelta() for up to ``maxsize``
+    distinct intervals, or disable the cache if it is 0 (the default).
+    """
+    global _format_cache
+    _format_cache = lru_cache(maxsize=maxsize, typed=True)(_format_components) if maxsize else None
+
+
+def _format(*components):
+    if _format_cache is not None:
+        return _format_cache(*components)
+    return _format_components(*components)
+
+
+# Format a database value like format_relativedelta(parse_relativedelta(value)),
+# but without building a relativedelta when it is in one of the known layouts
+def format_db_relativedelta(value):
+    m = _pg_re.match(value)
+    pg = m is not None
+    if not pg:
+        m = _csv_re.match(value)
+        if m is None:
+            return format_relativedelta(parse_relativedelta(value))
+    return _format(*_fix_components(*_db_components(m, pg)))
+
+
+def _iso8601_components(value):
+    m = _canonical_iso8601_re.match(value)
+    if m is None or value == 'P' or value[-1] == 'T':
+        return None
+    years, months, days, hours, minutes, seconds, fraction = m.groups()
+    microseconds = 0
+    if fraction is not None:
+        microseconds = int(fraction.ljust(6, '0'))
+        if seconds[0] == '-':
+            microseconds = -microseconds
+    return _fix_components(int(years or 0), int(months or 0), int(days or 0), int(hours or 0),
+                           int(minutes or 0), int(seconds or 0), microseconds)
+
+
+# Convert an ISO8601 timespec as written by format_relativedelta() to the
+# database representation, without building a relativedelta.  Returns None
+# for anything else, which has to go through parse_relativedelta() instead.
+def prepare_db_relativedelta(value, postgresql):
+    components = _iso8601_components(value)
+    if components is None:
+        return None
+    if postgresql:
+        # PostgreSQL reads this format itself
+        return value
+    return CSV_FORMAT % components
+
+
+# Parse a timespec string to a tuple of the COMPONENTS of the normalized
+# relativedelta, which is much cheaper to build and to pickle
+def parse_relativedelta_components(value):
+    if value is None or value == '':
+        return None
+    elif isinstance(value, str):
+        m = _pg_re.match(value)
+        if m is not None:
+            return _fix_components(*_db_components(m, True))
+        m = _csv_re.match(value)
+        if m is not None:
+            return _fix_components(*_db_components(m, False))
+        components = _iso8601_components(value)
+        if components is not None:
+            return components
+    rd = parse_relativedelta(value)
+    return tuple(getattr(rd, name) for name in COMPONENTS)
+
+
+def relativedelta_from_components(components):
+    return relativedelta(**dict(zip(COMPONENTS, components))) if components is not None else None
+
+
+def _parse_components_chunk(values):
+    return [parse_relativedelta_components(value) for value in values]
+
+
+# Parse timespec strings to component tuples, split across a process pool.
+# Smaller inputs are parsed in this process, as starting a pool and
+# sending the values over would take longer.  Pass an existing
+# concurrent.futures executor to reuse its workers.
+def parse_relativedelta_parallel(values, max_workers=None, chunksize=20000, threshold=100000, executor=None):
+    values = list(values)
+    if len(values) < threshold or max_workers == 1:
+        return _parse_components_chunk(values)
+    chunks = [values[i:i + chunksize] for i in range(0, len(values), chunksize)]
+    if executor is None:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return parse_relativedelta_parallel(values, chunksize=chunksize, threshold=0, executor=executor)
+    result = []
+    # map() returns the results in the order of the chunks
+    for chunk in executor.map(_parse_components_chunk, chunks):
+        result.extend(chunk)
+    return result
+
+
+def relativedelta_array_as_csv(values) -> str:
+    return ARRAY_SEPARATOR.join(relativedelta_as_csv(value) for value in values)
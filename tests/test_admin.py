@@ -0,0 +1,81 @@
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from testapp.models import DictionaryInterval, Interval
+
+from relativedeltafield.admin import RelativeDeltaListFilter
+from relativedeltafield.models import RelativeDeltaDictionary
+
+
+class RelativeDeltaListFilterTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        RelativeDeltaDictionary.objects.clear_cache()
+        self.user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+
+    def get_changelist(self, model, **params):
+        model_admin = admin.ModelAdmin(model, admin.site)
+        model_admin.list_filter = ['value']
+        request = RequestFactory().get('/', params)
+        request.user = self.user
+        return model_admin.get_changelist_instance(request)
+
+    def get_choices(self, changelist):
+        list_filter = changelist.filter_specs[0]
+        self.assertIsInstance(list_filter, RelativeDeltaListFilter)
+        return [(choice['display'], choice['selected']) for choice in list_filter.choices(changelist)]
+
+    def test_choices(self):
+        for value in ('P1M', 'P1M', 'PT90M', None):
+            Interval.objects.create(value=value)
+
+        changelist = self.get_changelist(Interval)
+        self.assertEqual(
+            [('All', True), ('PT1H30M (1)', False), ('P1M (2)', False), ('- (1)', False)],
+            self.get_choices(changelist)
+        )
+        self.assertEqual(4, changelist.queryset.count())
+
+        changelist = self.get_changelist(Interval, value__exact='P1M')
+        self.assertEqual(
+            [('All', False), ('PT1H30M (1)', False), ('P1M (2)', True), ('- (1)', False)],
+            self.get_choices(changelist)
+        )
+        self.assertEqual(2, changelist.queryset.count())
+
+        changelist = self.get_changelist(Interval, value__isnull='True')
+        self.assertEqual(1, changelist.queryset.count())
+
+    def test_choices_are_ordered_by_value(self):
+        for value in ('P-1D', 'P-2D', 'P1D', 'P30D', 'P1M', 'PT-1S'):
+            Interval.objects.create(value=value)
+
+        # Intervals PostgreSQL considers equal are listed separately
+        self.assertEqual(
+            ['All', 'P-2D (1)', 'P-1D (1)', 'PT-1S (1)', 'P1D (1)', 'P30D (1)', 'P1M (1)'],
+            [display for display, selected in self.get_choices(self.get_changelist(Interval))]
+        )
+
+    def test_buckets_are_cached(self):
+        Interval.objects.create(value='P1M')
+        self.get_changelist(Interval)
+        Interval.objects.create(value='P1D')
+
+        # The bucket list isn't queried again, only the changelist itself
+        with self.assertNumQueries(0):
+            model_admin = admin.ModelAdmin(Interval, admin.site)
+            request = RequestFactory().get('/')
+            RelativeDeltaListFilter(Interval._meta.get_field('value'), request, {}, Interval, model_admin, 'value')
+        self.assertEqual([('All', True), ('P1M (1)', False)], self.get_choices(self.get_changelist(Interval)))
+
+        cache.clear()
+        self.assertEqual(3, len(self.get_choices(self.get_changelist(Interval))))
+
+    def test_dictionary_field(self):
+        for value in ('P1M', 'P1M', 'P1D'):
+            DictionaryInterval.objects.create(value=value)
+
+        changelist = self.get_changelist(DictionaryInterval, value__exact='P1D')
+        self.assertEqual([('All', False), ('P1D (1)', True), ('P1M (2)', False)], self.get_choices(changelist))
+        self.assertEqual(1, changelist.queryset.count())
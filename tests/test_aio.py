@@ -0,0 +1,115 @@
+import asyncio
+import time
+from unittest import skipIf
+
+import django
+from dateutil.relativedelta import relativedelta
+from django.db.models import F
+from django.test import TestCase
+from testapp.models import DictionaryInterval, Interval, Schedule
+
+from relativedeltafield.models import RelativeDeltaDictionary
+
+try:
+    from relativedeltafield.aio import abulk_create, aiter_intervals, asum_intervals
+except ImportError:  # asgiref is only installed along with Django 3.0 and up
+    pass
+
+
+async def _ticker(stop, gaps):
+    # Measures how long the event loop is unavailable to other coroutines
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+
+
+@skipIf(django.VERSION < (4, 1), 'The async ORM requires Django 4.1')
+class AsyncHelpersTest(TestCase):
+    values = [
+        relativedelta(years=2, months=3, days=4, hours=5, minutes=52, seconds=30, microseconds=5),
+        relativedelta(days=-1, seconds=-1, microseconds=-500000),
+        relativedelta(months=1),
+        None,
+    ]
+
+    def setUp(self):
+        RelativeDeltaDictionary.objects.clear_cache()
+
+    async def test_aiter_intervals(self):
+        await abulk_create(Interval, [Interval(value=value) for value in self.values])
+
+        values = [v async for v in aiter_intervals(Interval.objects.order_by('pk'), 'value', flat=True)]
+        self.assertEqual(self.values, values)
+
+        # Small batches, converted in a worker thread
+        rows = [row async for row in aiter_intervals(Interval.objects.order_by('pk'), 'pk', 'value',
+                                                     batch_size=3, offload_threshold=0)]
+        self.assertEqual(self.values, [value for pk, value in rows])
+
+        with self.assertRaises(TypeError):
+            [row async for row in aiter_intervals(Interval.objects.all(), 'pk', 'value', flat=True)]
+
+    async def test_aiter_intervals_other_fields(self):
+        await abulk_create(Schedule, [Schedule(offsets=[relativedelta(days=1), relativedelta(hours=2)])])
+        await abulk_create(DictionaryInterval, [DictionaryInterval(value='P1M')])
+
+        self.assertEqual([[relativedelta(days=1), relativedelta(hours=2)]],
+                         [v async for v in aiter_intervals(Schedule.objects.all(), 'offsets', flat=True)])
+        self.assertEqual([relativedelta(months=1)],
+                         [v async for v in aiter_intervals(DictionaryInterval.objects.all(), 'value', flat=True)])
+
+    async def test_aiter_intervals_resolves_columns_from_the_query(self):
+        await abulk_create(Interval, [Interval(value='P1M')])
+        await abulk_create(Schedule, [Schedule(offsets=[relativedelta(days=1)])])
+
+        # All columns, and annotations
+        rows = [row async for row in aiter_intervals(Interval.objects.all())]
+        self.assertEqual([relativedelta(months=1)], [value for pk, value, date in rows])
+        self.assertEqual([relativedelta(months=1)],
+                         [v async for v in aiter_intervals(Interval.objects.annotate(v=F('value')), 'v', flat=True)])
+        rows = [row async for row in aiter_intervals(Interval.objects.annotate(v=F('value')))]
+        self.assertEqual([(relativedelta(months=1),) * 2], [(value, v) for pk, value, date, v in rows])
+        rows = [row async for row in aiter_intervals(Schedule.objects.all())]
+        self.assertEqual([[relativedelta(days=1)]], [offsets for pk, offsets in rows])
+
+    async def test_abulk_create_keeps_values(self):
+        objs = [Interval(value='PT90M'), Interval(value=relativedelta(weeks=1))]
+        await abulk_create(Interval, objs, offload_threshold=0)
+        self.assertEqual([relativedelta(hours=1, minutes=30), relativedelta(days=7)], [obj.value for obj in objs])
+        self.assertEqual(1, await Interval.objects.filter(value='PT1H30M').acount())
+
+    async def test_asum_intervals(self):
+        self.assertIsNone(await asum_intervals(Interval.objects.all(), 'value'))
+        await abulk_create(Interval, [Interval(value=value) for value in self.values])
+        self.assertEqual(
+            self.values[0] + self.values[1] + self.values[2],
+            await asum_intervals(Interval.objects.all(), 'value', batch_size=3, offload_threshold=0)
+        )
+        with self.assertRaises(TypeError):
+            await asum_intervals(DictionaryInterval.objects.all(), 'value')
+
+    async def test_latency_under_concurrent_load(self):
+        count = 10000
+        await abulk_create(Interval, [Interval(value=relativedelta(days=i % 30, seconds=i % 60))
+                                      for i in range(count)])
+
+        async def load():
+            n = 0
+            async for value in aiter_intervals(Interval.objects.all(), 'value', flat=True):
+                n += 1
+            return n
+
+        stop = asyncio.Event()
+        gaps = []
+        ticker = asyncio.ensure_future(_ticker(stop, gaps))
+        results = await asyncio.gather(*[load() for i in range(3)], asum_intervals(Interval.objects.all(), 'value'))
+        stop.set()
+        await ticker
+
+        self.assertEqual([count] * 3, results[:3])
+        # The loop kept ticking while the schedules were loaded
+        self.assertGreater(len(gaps), 10)
+        self.assertLess(max(gaps), 0.25)
@@ -0,0 +1,110 @@
+from unittest import mock, skipIf
+
+import django
+from dateutil.relativedelta import relativedelta
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.test import TestCase, skipUnlessDBFeature
+from testapp.models import CheckedInterval, DictionaryInterval, Interval
+
+from relativedeltafield.bulk import bulk_create_trusted
+from relativedeltafield.fields import RelativeDeltaField
+from relativedeltafield.utils import format_relativedelta
+
+
+class TrustedBulkCreateTest(TestCase):
+    values = [
+        relativedelta(years=2, months=3, days=4, hours=5, minutes=52, seconds=30, microseconds=5),
+        relativedelta(days=-1, seconds=-1, microseconds=-500000),
+        relativedelta(months=1),
+    ]
+
+    def db_values(self):
+        if connection.vendor == 'postgresql':
+            return [format_relativedelta(value) for value in self.values]
+        return [RelativeDeltaField().get_db_prep_save(value, connection) for value in self.values]
+
+    def test_deconstruct(self):
+        name, path, args, kwargs = CheckedInterval._meta.get_field('value').deconstruct()
+        self.assertEqual({'check_format': True, 'null': True, 'blank': True}, kwargs)
+        name, path, args, kwargs = Interval._meta.get_field('value').deconstruct()
+        self.assertNotIn('check_format', kwargs)
+
+    def test_db_check(self):
+        field = CheckedInterval._meta.get_field('value')
+        if connection.vendor == 'postgresql':
+            self.assertIsNone(field.db_check(connection))
+        else:
+            self.assertIn(connection.ops.quote_name('value'), field.db_check(connection))
+        self.assertIsNone(Interval._meta.get_field('value').db_check(connection))
+        self.assertIsNone(DictionaryInterval._meta.get_field('value').db_check(connection))
+
+    @skipUnlessDBFeature('supports_column_check_constraints')
+    def test_check_constraint(self):
+        CheckedInterval.objects.create(value=self.values[0])
+        CheckedInterval.objects.create(value=None)
+        CheckedInterval.objects.create(value=relativedelta(months=-11, days=-99, hours=-23, minutes=-59, seconds=-59,
+                                                           microseconds=-999999))
+        CheckedInterval.objects.create(value=relativedelta(months=11, days=999, hours=23, minutes=59, seconds=59,
+                                                           microseconds=999999))
+        if connection.vendor == 'postgresql':
+            return
+        table = connection.ops.quote_name(CheckedInterval._meta.db_table)
+        for value in ['P1D', '00001/000/000 000:000:000.000000', '0001/000/000 000:000:000.0000000',
+                      # Not normalized
+                      '00000/000/000 099:099:099.9999999', '00000/012/000 000:000:000.0000000',
+                      '00000/000/000 024:000:000.0000000', '00000/000/000 000:060:000.0000000',
+                      '00000/000/000 000:000:-60.0000000', '00000/000/000 000:000:000.1000000']:
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute('INSERT INTO %s (value) VALUES (%%s)' % table, [value])
+
+    @skipUnlessDBFeature('supports_column_check_constraints')
+    def test_bulk_create_trusted(self):
+        objs = [CheckedInterval(value=value) for value in self.db_values()]
+        with mock.patch('relativedeltafield.fields.parse_relativedelta') as parse:
+            bulk_create_trusted(CheckedInterval, objs)
+        parse.assert_not_called()
+        # Other values are converted as usual
+        bulk_create_trusted(CheckedInterval, [CheckedInterval(value=self.values[0])])
+        # The objects keep their original values
+        self.assertEqual(self.db_values()[0], objs[0].__dict__['value'])
+
+        values = [obj.value for obj in CheckedInterval.objects.order_by('pk')]
+        self.assertEqual(self.values + self.values[:1], values)
+
+    @skipUnlessDBFeature('supports_column_check_constraints')
+    def test_bulk_create_trusted_invalid(self):
+        # Rejected by the CHECK constraint, or by INTERVAL input on PostgreSQL
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            bulk_create_trusted(CheckedInterval, [CheckedInterval(value='bogus')])
+
+    def test_bulk_create_trusted_unchecked(self):
+        if connection.vendor == 'postgresql':
+            bulk_create_trusted(Interval, [Interval(value=value) for value in self.db_values()])
+            self.assertEqual(self.values, [obj.value for obj in Interval.objects.order_by('pk')])
+        else:
+            with self.assertRaisesMessage(ValueError, 'testapp.Interval.value'):
+                bulk_create_trusted(Interval, [Interval(value=value) for value in self.db_values()])
+            self.assertFalse(Interval.objects.exists())
+
+    def test_bulk_create_trusted_unenforced(self):
+        # Like on MySQL before 8.0.16, which ignores CHECK constraints
+        with mock.patch.object(connection.features, 'supports_column_check_constraints', False):
+            if connection.vendor == 'postgresql':
+                bulk_create_trusted(CheckedInterval, [CheckedInterval(value=value) for value in self.db_values()])
+            else:
+                with self.assertRaisesMessage(ValueError, 'testapp.CheckedInterval.value'):
+                    bulk_create_trusted(CheckedInterval, [CheckedInterval(value=v) for v in self.db_values()])
+
+    @skipIf(django.VERSION < (4, 1), 'The async ORM requires Django 4.1')
+    async def test_abulk_create_trusted(self):
+        # skipUnlessDBFeature() would wrap the coroutine function, so that
+        # the test is never awaited
+        if not connection.features.supports_column_check_constraints:
+            self.skipTest("Database doesn't support feature(s): supports_column_check_constraints")
+        from relativedeltafield.aio import abulk_create
+
+        objs = [CheckedInterval(value=value) for value in self.db_values()]
+        await abulk_create(CheckedInterval, objs, trusted=True)
+        values = [obj.value async for obj in CheckedInterval.objects.order_by('pk')]
+        self.assertEqual(self.values, values)
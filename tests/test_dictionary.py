@@ -0,0 +1,139 @@
+from unittest import skipIf
+
+import django
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import FieldError
+from django.db import IntegrityError, connection, transaction
+from django.db.migrations.autodetector import MigrationAutodetector
+from django.db.migrations.state import ModelState, ProjectState
+from django.db.models import ProtectedError
+from django.test import TestCase
+from testapp.models import DictionaryInterval
+
+from relativedeltafield import RelativeDeltaField
+from relativedeltafield.models import RelativeDeltaDictionary
+
+
+class DictionaryRelativeDeltaFieldTest(TestCase):
+    def setUp(self):
+        RelativeDeltaDictionary.objects.clear_cache()
+
+    def test_value_survives_db_roundtrip(self):
+        input_value = relativedelta(years=2, months=3, days=4, hours=5, minutes=52, seconds=30, microseconds=5)
+        obj = DictionaryInterval(value=input_value)
+        obj.save()
+
+        obj.refresh_from_db()
+        self.assertEqual(input_value, obj.value)
+
+        obj = DictionaryInterval(value=None)
+        obj.save()
+
+        obj.refresh_from_db()
+        self.assertIsNone(obj.value)
+
+    def test_equal_values_share_a_code(self):
+        DictionaryInterval.objects.create(value='P1M')
+        DictionaryInterval.objects.create(value=relativedelta(months=1))
+        DictionaryInterval.objects.create(value='P1D')
+
+        self.assertEqual(2, RelativeDeltaDictionary.objects.count())
+        self.assertEqual(
+            ['00000/001/000 000:000:000.0000000', '00000/000/001 000:000:000.0000000'],
+            list(RelativeDeltaDictionary.objects.order_by('pk').values_list('value', flat=True))
+        )
+
+    def test_values_are_parsed_once(self):
+        DictionaryInterval.objects.create(value='P1M')
+        DictionaryInterval.objects.create(value='P1M')
+        RelativeDeltaDictionary.objects.clear_cache()
+
+        # One query for the rows and one to load the dictionary
+        with self.assertNumQueries(2):
+            values = list(DictionaryInterval.objects.values_list('value', flat=True))
+        self.assertEqual([relativedelta(months=1)] * 2, values)
+        self.assertIs(values[0], values[1])
+
+        with self.assertNumQueries(1):
+            list(DictionaryInterval.objects.values_list('value', flat=True))
+
+    def test_missing_values_are_looked_up_once(self):
+        DictionaryInterval.objects.create(value='P1M')
+        RelativeDeltaDictionary.objects.clear_cache()
+        DictionaryInterval.objects.filter(value='P1M').count()
+
+        # One query for the code and one for the rows, the dictionary is
+        # only loaded as a whole once
+        with self.assertNumQueries(10):
+            for i in range(5):
+                DictionaryInterval.objects.filter(value='P1Y').count()
+
+    def test_rolled_back_codes_are_not_cached(self):
+        class Rollback(Exception):
+            pass
+
+        with self.assertRaises(Rollback), transaction.atomic():
+            DictionaryInterval.objects.create(value='P1M')
+            raise Rollback
+        obj = DictionaryInterval.objects.create(value='P1M')
+        self.assertEqual(1, RelativeDeltaDictionary.objects.count())
+
+        RelativeDeltaDictionary.objects.clear_cache()
+        obj.refresh_from_db()
+        self.assertEqual(relativedelta(months=1), obj.value)
+
+    @skipIf(django.VERSION < (3, 2), 'captureOnCommitCallbacks() requires Django 3.2')
+    def test_codes_are_cached_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            DictionaryInterval.objects.create(value='P1M')
+            # Not committed yet, so the code is looked up again
+            with self.assertNumQueries(2):
+                DictionaryInterval.objects.create(value='P1M')
+
+        with self.assertNumQueries(1):
+            DictionaryInterval.objects.create(value='P1M')
+
+    def test_codes_reference_the_dictionary(self):
+        table = connection.ops.quote_name(DictionaryInterval._meta.db_table)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute('INSERT INTO %s (value) VALUES (%%s)' % table, [99])
+            connection.check_constraints()
+
+    def test_filtering_works(self):
+        DictionaryInterval.objects.create(value='P1M')
+        DictionaryInterval.objects.create(value='P1D')
+        DictionaryInterval.objects.create(value=None)
+
+        self.assertEqual(1, DictionaryInterval.objects.filter(value='P1M').count())
+        self.assertEqual(2, DictionaryInterval.objects.filter(value__in=['P1M', 'P1D', 'P1Y']).count())
+        self.assertEqual(1, DictionaryInterval.objects.filter(value__isnull=True).count())
+
+        # Lookups never add values to the dictionary
+        self.assertEqual(0, DictionaryInterval.objects.filter(value='P1Y').count())
+        self.assertEqual(2, RelativeDeltaDictionary.objects.count())
+
+        with self.assertRaises(FieldError):
+            DictionaryInterval.objects.filter(value__gt='P1D').count()
+
+    def test_entries_in_use_are_protected(self):
+        DictionaryInterval.objects.create(value='P1M')
+
+        with self.assertRaises(ProtectedError):
+            RelativeDeltaDictionary.objects.all().delete()
+
+    def test_deconstruct(self):
+        name, path, args, kwargs = RelativeDeltaField(dictionary=True).deconstruct()
+        self.assertEqual({'dictionary': True}, kwargs)
+        self.assertEqual('relativedeltafield.fields.RelativeDeltaField', path)
+        name, path, args, kwargs = RelativeDeltaField().deconstruct()
+        self.assertEqual({}, kwargs)
+
+    def test_migrations_depend_on_the_dictionary(self):
+        before = ProjectState()
+        before.add_model(ModelState.from_model(RelativeDeltaDictionary))
+        after = before.clone()
+        after.add_model(ModelState.from_model(DictionaryInterval))
+
+        changes = MigrationAutodetector(before, after)._detect_changes()
+        self.assertIn(('relativedeltafield', '__first__'), changes['testapp'][0].dependencies)
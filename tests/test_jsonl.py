@@ -0,0 +1,64 @@
+from unittest import mock, skipIf
+
+import django
+from dateutil.relativedelta import relativedelta
+from django.core import serializers
+from django.test import TestCase
+from testapp.models import Interval, Schedule
+
+from relativedeltafield import fields
+
+try:
+    from relativedeltafield.jsonl import Deserializer, Serializer
+except ImportError:  # django.core.serializers.jsonl was added in Django 3.2
+    pass
+
+
+@skipIf(django.VERSION < (3, 2), 'The JSON Lines serializer requires Django 3.2')
+class JSONLSerializerTest(TestCase):
+    values = [
+        relativedelta(years=2, months=3, days=4, hours=5, minutes=52, seconds=30, microseconds=5),
+        relativedelta(days=-1, seconds=-1, microseconds=-500000),
+        relativedelta(hours=1, minutes=30),
+        None,
+    ]
+
+    def test_output_matches_jsonl_serializer(self):
+        for value in self.values:
+            Interval.objects.create(value=value)
+        Schedule.objects.create(offsets=[relativedelta(months=1), relativedelta(hours=-2)])
+
+        for model in (Interval, Schedule):
+            expected = serializers.serialize('jsonl', model.objects.order_by('pk'))
+            with mock.patch.object(fields, 'parse_relativedelta') as parse, \
+                    mock.patch.object(fields, 'parse_relativedelta_array') as parse_array:
+                output = Serializer().serialize(model.objects.order_by('pk'))
+                self.assertFalse(parse.called)
+                self.assertFalse(parse_array.called)
+            self.assertEqual(expected, output)
+
+    def test_roundtrip(self):
+        for value in self.values:
+            Interval.objects.create(value=value)
+        data = Serializer().serialize(Interval.objects.order_by('pk'))
+        Interval.objects.all().delete()
+
+        with mock.patch.object(fields, 'parse_relativedelta', wraps=fields.parse_relativedelta) as parse:
+            for deserialized in Deserializer(data.encode()):
+                deserialized.save()
+            self.assertFalse(parse.called)
+        self.assertEqual(self.values, [obj.value for obj in Interval.objects.order_by('pk')])
+
+    def test_lines_are_read_one_at_a_time(self):
+        Interval.objects.create(value='P1M')
+        Interval.objects.create(value='P1D')
+        lines = iter(Serializer().serialize(Interval.objects.order_by('pk')).splitlines(keepends=True))
+        Interval.objects.all().delete()
+
+        objects = Deserializer(lines)
+        self.assertEqual(relativedelta(months=1), next(objects).object.value)
+        self.assertEqual(1, len(list(lines)))
+
+    def test_invalid_lines_raise_deserialization_errors(self):
+        with self.assertRaises(serializers.base.DeserializationError):
+            list(Deserializer('{"model": "testapp.interval", "pk": 1, "fields": {}}\n{'))
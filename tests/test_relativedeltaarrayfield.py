@@ -0,0 +1,97 @@
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from testapp.models import Schedule
+
+from relativedeltafield import RelativeDeltaArrayField, RelativeDeltaArrayFormField
+
+
+class RelativeDeltaArrayFieldTest(TestCase):
+    def setUp(self):
+        Schedule.objects.all().delete()
+
+    def test_values_survive_db_roundtrip(self):
+        input_value = [
+            relativedelta(years=2, months=3, days=4, hours=5, minutes=52, seconds=30, microseconds=5),
+            relativedelta(days=-1, seconds=-1, microseconds=-500000),
+            relativedelta(),
+        ]
+        obj = Schedule(offsets=input_value)
+        obj.save()
+
+        obj.refresh_from_db()
+        self.assertEqual(input_value, obj.offsets)
+        for value in obj.offsets:
+            self.assertEqual(int, type(value.seconds))
+            self.assertEqual(int, type(value.microseconds))
+
+    def test_empty_list_survives_db_roundtrip(self):
+        obj = Schedule(offsets=[])
+        obj.save()
+
+        obj.refresh_from_db()
+        self.assertEqual([], obj.offsets)
+
+    def test_none_value_survives_db_roundtrip(self):
+        obj = Schedule(offsets=None)
+        obj.save()
+
+        obj.refresh_from_db()
+        self.assertIsNone(obj.offsets)
+
+    def test_string_input(self):
+        obj = Schedule(offsets='P1D, PT1H30M')
+        obj.full_clean()
+        self.assertEqual([relativedelta(days=1), relativedelta(hours=1, minutes=30)], obj.offsets)
+
+        obj.offsets = ['P1W', relativedelta(months=1)]
+        obj.save()
+        self.assertEqual([[relativedelta(days=7), relativedelta(months=1)]],
+                         list(Schedule.objects.values_list('offsets', flat=True)))
+
+    def test_invalid_inputs_raise_validation_error(self):
+        obj = Schedule()
+
+        obj.offsets = 'P1D,blabla'
+        with self.assertRaises(ValidationError) as cm:
+            obj.full_clean()
+        self.assertEqual(set(['offsets']), set(cm.exception.message_dict.keys()))
+
+        obj.offsets = ['P1D', None]
+        with self.assertRaises(ValidationError):
+            obj.full_clean()
+
+        obj.offsets = ['P1D']  # Check that the error is cleared when made valid again
+        obj.full_clean()
+
+    def test_values_are_kept_on_the_instance(self):
+        obj = Schedule.objects.create(offsets='P1D')
+        obj.refresh_from_db()
+        self.assertIs(obj.offsets, obj.offsets)
+
+        obj.offsets.append(relativedelta(hours=2))
+        obj.save()
+        obj.refresh_from_db()
+        self.assertEqual([relativedelta(days=1), relativedelta(hours=2)], obj.offsets)
+
+        obj = Schedule(offsets=['P1D', relativedelta(hours=25)])
+        self.assertEqual([relativedelta(days=1), relativedelta(days=1, hours=1)], obj.offsets)
+        self.assertIs(obj.offsets, obj.offsets)
+
+    def test_unsupported_options(self):
+        with self.assertRaises(TypeError):
+            RelativeDeltaArrayField(dictionary=True)
+        with self.assertRaises(TypeError):
+            RelativeDeltaArrayField(check_format=True)
+
+    def test_value_to_string(self):
+        obj = Schedule(offsets=[relativedelta(months=1), relativedelta(hours=2)])
+        self.assertEqual('P1M,PT2H', Schedule._meta.get_field('offsets').value_to_string(obj))
+
+    def test_formfield(self):
+        field = RelativeDeltaArrayField().formfield()
+        self.assertIsInstance(field, RelativeDeltaArrayFormField)
+        self.assertEqual('P1M,PT2H', field.prepare_value([relativedelta(months=1), relativedelta(hours=2)]))
+        self.assertEqual([relativedelta(days=3)], field.clean('P3D'))
+        with self.assertRaises(ValidationError):
+            field.clean('P3D,')
@@ -10,7 +10,7 @@ from django.db.models.functions import Cast
 from django.test import TestCase
 from testapp.models import Interval
 
-from relativedeltafield import RelativeDeltaField
+from relativedeltafield import RelativeDeltaField, RelativeDeltaFormField
 
 
 class RelativeDeltaFieldTest(TestCase):
@@ -230,6 +230,16 @@ class RelativeDeltaFieldTest(TestCase):
         q = Interval.objects.filter(value__gt='P9D')
         self.assertEqual(2, q.count())
 
+    def test_formfield(self):
+        self.assertIsInstance(RelativeDeltaField().formfield(), RelativeDeltaFormField)
+
+    def test_admin_formfield(self):
+        from django.contrib import admin
+
+        model_admin = admin.ModelAdmin(Interval, admin.site)
+        formfield = model_admin.formfield_for_dbfield(Interval._meta.get_field('value'), request=None)
+        self.assertIsInstance(formfield, RelativeDeltaFormField)
+
     @pytest.mark.xfail(django.VERSION[0] < 3, reason="Incompatible with Django < 3")
     def test_value_usable_as_timedelta(self):
         obj1 = Interval(value='P1Y2M3W4DT5H6M7S')
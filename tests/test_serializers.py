@@ -0,0 +1,100 @@
+from unittest import mock
+
+from dateutil.relativedelta import relativedelta
+from django.core import serializers
+from django.db.models.signals import post_save, pre_save
+from django.test import TestCase
+from testapp.models import Interval, Schedule
+
+from relativedeltafield import fields
+from relativedeltafield.serializers import Deserializer, Serializer
+
+
+class SerializerTest(TestCase):
+    def setUp(self):
+        Interval.objects.all().delete()
+        Schedule.objects.all().delete()
+
+    def test_output_matches_json_serializer(self):
+        Interval.objects.create(value=relativedelta(years=2, months=3, days=4, hours=5, minutes=52, seconds=30,
+                                                    microseconds=5))
+        Interval.objects.create(value=relativedelta(days=-1, seconds=-1, microseconds=-500000))
+        Interval.objects.create(value=relativedelta())
+        Interval.objects.create(value=None)
+        Schedule.objects.create(offsets=[relativedelta(months=1), relativedelta(hours=-2)])
+        Schedule.objects.create(offsets=[])
+
+        for model in (Interval, Schedule):
+            expected = serializers.serialize('json', model.objects.order_by('pk'))
+            with mock.patch.object(fields, 'parse_relativedelta') as parse, \
+                    mock.patch.object(fields, 'parse_relativedelta_array') as parse_array:
+                output = Serializer().serialize(model.objects.order_by('pk'))
+                self.assertFalse(parse.called)
+                self.assertFalse(parse_array.called)
+            self.assertEqual(expected, output)
+
+    def test_raw_db_values(self):
+        Interval.objects.create(value='P1M')
+        with fields.raw_db_values():
+            value = Interval.objects.values_list('value', flat=True).get()
+            obj = Interval.objects.get()
+        self.assertIsInstance(value, str)
+        self.assertEqual(relativedelta(months=1), obj.value)
+        self.assertEqual(relativedelta(months=1), Interval.objects.values_list('value', flat=True).get())
+
+    def test_raw_db_values_only_apply_to_the_queryset(self):
+        Interval.objects.create(value='P1M')
+        values = []
+
+        class RecordingSerializer(Serializer):
+            def end_object(self, obj):
+                values.append(Interval.objects.values_list('value', flat=True).get())
+                super().end_object(obj)
+
+        RecordingSerializer().serialize(Interval.objects.all())
+        self.assertEqual([relativedelta(months=1)], values)
+
+    def test_signals_receive_relativedeltas(self):
+        Interval.objects.create(value=relativedelta(hours=1, minutes=30))
+        data = Serializer().serialize(Interval.objects.all())
+        Interval.objects.all().delete()
+        values = []
+
+        def receiver(sender, instance, **kwargs):
+            values.append(instance.value)
+
+        pre_save.connect(receiver, sender=Interval)
+        post_save.connect(receiver, sender=Interval)
+        try:
+            for deserialized in Deserializer(data):
+                deserialized.save()
+        finally:
+            pre_save.disconnect(receiver, sender=Interval)
+            post_save.disconnect(receiver, sender=Interval)
+        self.assertEqual([relativedelta(hours=1, minutes=30)] * 2, values)
+        self.assertEqual(relativedelta(hours=1, minutes=30), Interval.objects.get().value)
+
+    def test_roundtrip(self):
+        values = [
+            relativedelta(years=2, months=3, days=4, hours=5, minutes=52, seconds=30, microseconds=5),
+            relativedelta(days=-1, seconds=-1, microseconds=-500000),
+            relativedelta(hours=1, minutes=30),
+            None,
+        ]
+        for value in values:
+            Interval.objects.create(value=value)
+        data = Serializer().serialize(Interval.objects.order_by('pk'))
+        Interval.objects.all().delete()
+
+        with mock.patch.object(fields, 'parse_relativedelta', wraps=fields.parse_relativedelta) as parse:
+            for deserialized in Deserializer(data):
+                deserialized.save()
+            self.assertFalse(parse.called)
+        self.assertEqual(values, [obj.value for obj in Interval.objects.order_by('pk')])
+        self.assertEqual(1, Interval.objects.filter(value='PT90M').count())
+
+    def test_non_canonical_values_are_parsed(self):
+        data = '[{"model": "testapp.interval", "pk": 1, "fields": {"value": "P1W1.5D", "date": "2020-10-21"}}]'
+        for deserialized in Deserializer(data):
+            deserialized.save()
+        self.assertEqual(relativedelta(days=8, hours=12), Interval.objects.get(pk=1).value)
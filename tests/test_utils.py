@@ -1,9 +1,23 @@
+import os
+import subprocess
+import sys
 from datetime import timedelta
 from unittest import TestCase
 
 from dateutil.relativedelta import relativedelta
 
-from relativedeltafield.utils import parse_relativedelta, relativedelta_as_csv
+import relativedeltafield
+from relativedeltafield.utils import (format_db_relativedelta,
+                                      format_relativedelta,
+                                      parse_relativedelta,
+                                      parse_relativedelta_array,
+                                      parse_relativedelta_components,
+                                      parse_relativedelta_parallel,
+                                      prepare_db_relativedelta,
+                                      relativedelta_array_as_csv,
+                                      relativedelta_as_csv,
+                                      relativedelta_from_components,
+                                      set_format_cache)
 
 
 class ParseRelativedeltaTest(TestCase):
@@ -59,3 +73,126 @@ class CSVFormatTest(TestCase):
                           hours=-12, minutes=27, seconds=-54,
                           microseconds=123456)
         )
+
+
+class ParseRelativedeltaArrayTest(TestCase):
+    def test_parse_csv_array(self):
+        values = [
+            relativedelta(years=1925, months=9, days=-4, hours=-12, minutes=27, seconds=54, microseconds=-123456),
+            relativedelta(years=-1925, months=9, days=-4, hours=-12, minutes=27, seconds=-54, microseconds=123456),
+        ]
+        self.assertEqual(values, parse_relativedelta_array(relativedelta_array_as_csv(values)))
+
+    def test_parse_postgres_array(self):
+        self.assertEqual(
+            [relativedelta(years=1, months=2, days=3, hours=4, minutes=5, seconds=6, microseconds=7),
+             relativedelta(days=-1, seconds=-1, microseconds=-500000),
+             relativedelta(microseconds=-500000)],
+            parse_relativedelta_array('P0001Y02M03DT04H05M06.000007S,'
+                                      'P0000Y00M-1DT00H00M-01.500000S,'
+                                      'P0000Y00M00DT00H00M-00.500000S')
+        )
+        # Only to_char() output, with six digits of microseconds, is parsed
+        # in a single pass; other ISO8601 values are parsed one by one.
+        self.assertEqual([relativedelta(seconds=1, microseconds=500000), relativedelta(days=1)],
+                         parse_relativedelta_array('P0Y0M0DT0H0M1.50000S,P1D'))
+
+    def test_parse_iso8601_array(self):
+        self.assertEqual([relativedelta(months=1), relativedelta(days=7, hours=1)],
+                         parse_relativedelta_array('P1M, P1WT1H'))
+        self.assertEqual([relativedelta(months=1)], parse_relativedelta_array(['P1M']))
+        self.assertEqual([], parse_relativedelta_array(''))
+        self.assertIsNone(parse_relativedelta_array(None))
+
+    def test_invalid_arrays(self):
+        for value in ('P1M,', 'P1M,,P1D', 'blabla', '01925/009/-04 -12:027:054.-123456,x', 1):
+            with self.assertRaises(ValueError):
+                parse_relativedelta_array(value)
+
+
+class FormatRelativedeltaTest(TestCase):
+    def test_format(self):
+        self.assertEqual('P0D', format_relativedelta(relativedelta()))
+        self.assertEqual('P1Y2M3DT4H5M6.000007S', format_relativedelta(
+            relativedelta(years=1, months=2, days=3, hours=4, minutes=5, seconds=6, microseconds=7)))
+        self.assertEqual('P-1DT-1.5S', format_relativedelta(relativedelta(days=-1, seconds=-1, microseconds=-500000)))
+        self.assertEqual('PT53.876544S', format_relativedelta(relativedelta(seconds=54, microseconds=-123456)))
+        self.assertEqual('P1.5D', format_relativedelta(relativedelta(days=1.5)))
+        self.assertEqual('P1.0DT2.0S', format_relativedelta(relativedelta(days=1.0, seconds=2.0)))
+        self.assertEqual('PT2.3S', format_relativedelta(relativedelta(seconds=2, microseconds=300000.0)))
+
+    def test_format_is_exact(self):
+        # These used to be computed in floating point
+        self.assertEqual('PT0.000001S', format_relativedelta(relativedelta(seconds=1, microseconds=-999999)))
+        self.assertEqual('PT3.839469S', format_relativedelta(relativedelta(seconds=3, microseconds=839469)))
+        # ... and these were lost
+        self.assertEqual('PT0.5S', format_relativedelta(relativedelta(microseconds=500000)))
+        self.assertEqual('PT-0.000001S', format_relativedelta(relativedelta(microseconds=-1)))
+
+    def test_format_cache(self):
+        set_format_cache(2)
+        try:
+            for i in range(3):
+                self.assertEqual('P1M', format_relativedelta(relativedelta(months=1)))
+                self.assertEqual('PT1H30M', format_relativedelta(relativedelta(hours=1, minutes=30)))
+            self.assertEqual('P1.0D', format_relativedelta(relativedelta(days=1.0)))
+            self.assertEqual('P1D', format_relativedelta(relativedelta(days=1)))
+        finally:
+            set_format_cache(0)
+
+
+class DBValueConversionTest(TestCase):
+    def test_format_db_relativedelta(self):
+        for value in ('01925/009/-04 -12:027:054.-123456', '-1925/009/-04 -12:027:-54.0123456',
+                      '00000/000/000 000:000:000.0000000', 'P0001Y02M03DT04H05M06.000007S',
+                      'P0000Y00M-1DT30H00M-01.500000S', 'P0000Y14M00DT00H00M00.000000S', 'P1W'):
+            self.assertEqual(format_relativedelta(parse_relativedelta(value)), format_db_relativedelta(value))
+
+    def test_prepare_db_relativedelta(self):
+        for value in ('P1Y2M3DT4H5M6.000007S', 'P-1DT-1.5S', 'PT90M', 'PT-0.5S', 'P13M', 'P0D'):
+            self.assertEqual(value, prepare_db_relativedelta(value, True))
+            self.assertEqual(relativedelta_as_csv(parse_relativedelta(value)), prepare_db_relativedelta(value, False))
+        for value in ('P', 'P1DT', 'P1W', 'P1.5D', 'PT1.1234567S', 'blabla'):
+            self.assertIsNone(prepare_db_relativedelta(value, True))
+            self.assertIsNone(prepare_db_relativedelta(value, False))
+
+
+class ParseRelativedeltaComponentsTest(TestCase):
+    values = ['01925/009/-04 -12:027:054.-123456', 'P0001Y02M03DT04H05M06.000007S', 'P1Y3M1W4.5DT5H70.5M80.10001S',
+              'PT-0.5S', 'P13M', '', None]
+
+    def test_components(self):
+        self.assertEqual((1925, 9, -4, -12, 27, 54, -123456),
+                         parse_relativedelta_components('01925/009/-04 -12:027:054.-123456'))
+        self.assertEqual((1, 3, 11, 18, 11, 50, 100010),
+                         parse_relativedelta_components('P1Y3M1W4.5DT5H70.5M80.10001S'))
+        for value in self.values:
+            self.assertEqual(parse_relativedelta(value),
+                             relativedelta_from_components(parse_relativedelta_components(value)))
+        with self.assertRaises(ValueError):
+            parse_relativedelta_components('blabla')
+
+    def test_parallel(self):
+        values = self.values * 5
+        expected = [parse_relativedelta_components(value) for value in values]
+        self.assertEqual(expected, parse_relativedelta_parallel(values))
+        self.assertEqual(expected, parse_relativedelta_parallel(values, max_workers=2, chunksize=3, threshold=0))
+        with self.assertRaises(ValueError):
+            parse_relativedelta_parallel(values + ['blabla'], max_workers=2, chunksize=3, threshold=0)
+
+
+class ImportTest(TestCase):
+    def test_utils_importable_without_django(self):
+        code = (
+            "import sys\n"
+            "class Blocker:\n"
+            "    def find_spec(self, name, path=None, target=None):\n"
+            "        if name == 'django' or name.startswith('django.'):\n"
+            "            raise ImportError(name)\n"
+            "sys.meta_path.insert(0, Blocker())\n"
+            "from relativedeltafield.utils import parse_relativedelta\n"
+            "print(parse_relativedelta('P1M').months)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(relativedeltafield.__file__)))
+        out = subprocess.check_output([sys.executable, '-c', code], env=env)
+        self.assertEqual(b'1', out.strip())
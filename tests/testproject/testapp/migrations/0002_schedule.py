@@ -0,0 +1,19 @@
+from django.db import migrations, models
+import relativedeltafield.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testapp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Schedule',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('offsets', relativedeltafield.fields.RelativeDeltaArrayField(blank=True, null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations, models
+import relativedeltafield.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('relativedeltafield', '0001_initial'),
+        ('testapp', '0002_schedule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DictionaryInterval',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', relativedeltafield.fields.RelativeDeltaField(blank=True, dictionary=True, null=True)),
+            ],
+        ),
+    ]
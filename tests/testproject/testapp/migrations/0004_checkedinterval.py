@@ -0,0 +1,19 @@
+from django.db import migrations, models
+import relativedeltafield.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testapp', '0003_dictionaryinterval'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CheckedInterval',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', relativedeltafield.fields.RelativeDeltaField(blank=True, check_format=True, null=True)),
+            ],
+        ),
+    ]
@@ -1,9 +1,21 @@
 import datetime
 
 from django.db import models
-from relativedeltafield import RelativeDeltaField
+from relativedeltafield import RelativeDeltaArrayField, RelativeDeltaField
 
 
 class Interval(models.Model):
     value = RelativeDeltaField(null=True, blank=True)
     date = models.DateField(default=datetime.date(2020, 10, 21))
+
+
+class Schedule(models.Model):
+    offsets = RelativeDeltaArrayField(null=True, blank=True)
+
+
+class DictionaryInterval(models.Model):
+    value = RelativeDeltaField(dictionary=True, null=True, blank=True)
+
+
+class CheckedInterval(models.Model):
+    value = RelativeDeltaField(check_format=True, null=True, blank=True)